@@ -47,6 +47,7 @@ from cupy._core._routines_manipulation import array_split  # NOQA
 from cupy._core._routines_manipulation import broadcast  # NOQA
 from cupy._core._routines_manipulation import broadcast_to  # NOQA
 from cupy._core._routines_manipulation import concatenate_method  # NOQA
+from cupy._core._routines_manipulation import concatenate_method_with_reshape  # NOQA
 from cupy._core._routines_manipulation import moveaxis  # NOQA
 from cupy._core._routines_manipulation import rollaxis  # NOQA
 from cupy._core._routines_manipulation import size  # NOQA
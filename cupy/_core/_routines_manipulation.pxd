@@ -24,6 +24,7 @@ cdef _ndarray_base _ndarray_squeeze(_ndarray_base self, axis)
 cdef _ndarray_base _ndarray_repeat(_ndarray_base self, repeats, axis)
 
 cpdef _ndarray_base _expand_dims(_ndarray_base a, tuple axis)
+cpdef _ndarray_base _insert_axis(_ndarray_base a, int axis)
 cpdef _ndarray_base moveaxis(_ndarray_base a, source, destination)
 cpdef _ndarray_base _move_single_axis(
     _ndarray_base a, Py_ssize_t source, Py_ssize_t destination)
@@ -37,4 +38,16 @@ cpdef _ndarray_base _transpose(
 cpdef _ndarray_base _concatenate(
     list arrays, Py_ssize_t axis, tuple shape, _ndarray_base out, str casting)
 cpdef _ndarray_base concatenate_method(
-    tup, int axis, _ndarray_base out=*, dtype=*, casting=*)
+    tup, int axis, out=*, dtype=*, casting=*,
+    bint flatten_inputs=*, bint always_copy=*)
+cpdef _ndarray_base concatenate_method_with_reshape(
+    tup, int reshape, int axis, out=*, dtype=*, casting=*)
+
+
+# Reshape rules accepted by concatenate_method_with_reshape.
+cpdef enum:
+    RESHAPE_INSERT_AXIS = 0
+    RESHAPE_ATLEAST_1D = 1
+    RESHAPE_ATLEAST_2D = 2
+    RESHAPE_ATLEAST_3D = 3
+    RESHAPE_COLUMN_2D = 4
@@ -277,6 +277,15 @@ cpdef _ndarray_base _expand_dims(_ndarray_base a, tuple axis):
     return _reshape(a, out_shape)
 
 
+cpdef _ndarray_base _insert_axis(_ndarray_base a, int axis):
+    """Returns a view with one length-1 axis inserted at ``axis``.
+
+    Unlike :func:`_expand_dims` this skips the reshape machinery; the
+    result is always a direct view of ``a``.
+    """
+    return _concat_reshape_view(a, RESHAPE_INSERT_AXIS, axis)
+
+
 cpdef _ndarray_base moveaxis(_ndarray_base a, source, destination):
     cdef shape_t src, dest
     cdef Py_ssize_t ndim = a.ndim
@@ -584,62 +593,226 @@ cpdef _ndarray_base _repeat(_ndarray_base a, repeats, axis=None):
 
 
 cpdef _ndarray_base concatenate_method(
-        tup, int axis, _ndarray_base out=None, dtype=None,
+        tup, int axis, out=None, dtype=None,
+        casting='same_kind', bint flatten_inputs=False,
+        bint always_copy=False):
+    cdef _ndarray_base a
+    cdef _ndarray_base out_arr = None
+
+    # ``out`` may be any __cuda_array_interface__ exporter (e.g. a view
+    # of mapped pinned memory); adopt it zero-copy so the concat kernels
+    # write straight into the caller's buffer.
+    if out is not None:
+        out_arr = core._convert_from_cupy_like(out, "Argument 'out'")
+
+    dev_id = device.get_device_id()
+    arrays = _preprocess_args(dev_id, tup, False)[0]
+    if flatten_inputs:
+        # concatenate(axis=None): flatten each input here so that a
+        # C-contiguous input costs only a metadata rewrite instead of a
+        # Python-level ravel() dispatch.
+        flat = []
+        for o in arrays:
+            if isinstance(o, _ndarray_base):
+                a = o
+                o = _ravel_view(a)
+            flat.append(o)
+        arrays = flat
+    return _concatenate_method_core(
+        arrays, axis, out_arr, dtype, casting, always_copy)
+
+
+cdef _ndarray_base _ravel_view(_ndarray_base a):
+    cdef shape_t shape
+    cdef strides_t strides
+    if a._shape.size() == 1:
+        return a
+    if a._c_contiguous:
+        shape.push_back(a.size)
+        strides.push_back(a.itemsize)
+        return a._view(type(a), shape, strides, True, True, a)
+    return _ndarray_ravel(a, 'C')
+
+
+cpdef _ndarray_base concatenate_method_with_reshape(
+        tup, int reshape, int axis, out=None, dtype=None,
         casting='same_kind'):
+    # Fuses the per-input ``expand_dims``/``atleast_*d`` pass of the
+    # stacking wrappers into the concatenation entry point so that the
+    # views are built here instead of via one Python-level call per input.
+    cdef list views = []
+    cdef list prepared = []
+    cdef _ndarray_base a
+    cdef _ndarray_base out_arr = None
+
+    if out is not None:
+        out_arr = core._convert_from_cupy_like(out, "Argument 'out'")
+
+    # Adopt __cuda_array_interface__ exporters zero-copy and transfer
+    # other objects (lists, numpy arrays, scalars) before the device
+    # check, which only accepts ndarrays; column_stack keeps rejecting
+    # anything that is not already on the GPU.
+    for o in tup:
+        if isinstance(o, _ndarray_base):
+            prepared.append(o)
+            continue
+        a = core._convert_from_cupy_like(o, False)
+        if a is None:
+            if reshape == RESHAPE_COLUMN_2D:
+                raise TypeError('Only cupy arrays can be column stacked')
+            a = core.array(o)
+        prepared.append(a)
+
+    dev_id = device.get_device_id()
+    arrays = _preprocess_args(dev_id, prepared, False)[0]
+    for o in arrays:
+        a = o
+        views.append(_concat_reshape_view(a, reshape, axis))
+    if reshape == RESHAPE_ATLEAST_1D and views:
+        # hstack semantics: 1-D inputs are joined along the first axis.
+        a = views[0]
+        if a._shape.size() == 1:
+            axis = 0
+    return _concatenate_method_core(views, axis, out_arr, dtype, casting)
+
+
+cdef _ndarray_base _concat_reshape_view(
+        _ndarray_base a, int rule, int axis):
+    cdef shape_t out_shape
+    cdef strides_t out_strides
+    cdef int ndim = <int>a._shape.size()
+    cdef int i, ax
+
+    cdef Py_ssize_t itemsize
+
+    # Hot path: the input already has enough dimensions, so no view is
+    # created at all.
+    if ((rule == RESHAPE_ATLEAST_1D and ndim >= 1)
+            or (rule == RESHAPE_ATLEAST_2D and ndim >= 2)
+            or (rule == RESHAPE_ATLEAST_3D and ndim >= 3)
+            or (rule == RESHAPE_COLUMN_2D and ndim == 2)):
+        return a
+
+    itemsize = a.itemsize
+
+    # Every rule only inserts length-1 axes, which is always expressible
+    # as a view; the shape and strides are assembled directly without
+    # going through the generic reshape machinery.
+    if rule == RESHAPE_INSERT_AXIS:
+        ax = internal._normalize_axis_index(axis, ndim + 1)
+        for i in range(ndim + 1):
+            if i == ax:
+                out_shape.push_back(1)
+                out_strides.push_back(itemsize)
+            elif i < ax:
+                out_shape.push_back(a._shape[i])
+                out_strides.push_back(a._strides[i])
+            else:
+                out_shape.push_back(a._shape[i - 1])
+                out_strides.push_back(a._strides[i - 1])
+    elif rule == RESHAPE_ATLEAST_1D:
+        out_shape.push_back(1)
+        out_strides.push_back(itemsize)
+    elif rule == RESHAPE_ATLEAST_2D:
+        out_shape.push_back(1)
+        out_strides.push_back(itemsize)
+        if ndim == 0:
+            out_shape.push_back(1)
+            out_strides.push_back(itemsize)
+        else:
+            out_shape.push_back(a._shape[0])
+            out_strides.push_back(a._strides[0])
+    elif rule == RESHAPE_ATLEAST_3D:
+        if ndim == 0:
+            out_shape.assign(<Py_ssize_t>3, <Py_ssize_t>1)
+            out_strides.assign(<Py_ssize_t>3, itemsize)
+        elif ndim == 1:
+            out_shape.push_back(1)
+            out_shape.push_back(a._shape[0])
+            out_shape.push_back(1)
+            out_strides.push_back(itemsize)
+            out_strides.push_back(a._strides[0])
+            out_strides.push_back(itemsize)
+        else:
+            out_shape.push_back(a._shape[0])
+            out_shape.push_back(a._shape[1])
+            out_shape.push_back(1)
+            out_strides.push_back(a._strides[0])
+            out_strides.push_back(a._strides[1])
+            out_strides.push_back(itemsize)
+    elif rule == RESHAPE_COLUMN_2D:
+        if ndim != 1:
+            raise ValueError(
+                'Only 1 or 2 dimensional arrays can be column stacked')
+        out_shape.push_back(a._shape[0])
+        out_shape.push_back(1)
+        out_strides.push_back(a._strides[0])
+        out_strides.push_back(itemsize)
+    else:
+        raise ValueError('Unknown reshape rule: {}'.format(rule))
+    return a._view(type(a), out_shape, out_strides, True, True, a)
+
+
+cdef _ndarray_base _concatenate_method_core(
+        list arrays, int axis, _ndarray_base out, dtype, casting,
+        bint always_copy=False):
     cdef int ndim0
     cdef int i
+    cdef Py_ssize_t k
+    cdef bint have_same_types
     cdef _ndarray_base a, a0
 
     if dtype is not None:
         dtype = get_dtype(dtype)
 
-    dev_id = device.get_device_id()
-    arrays = _preprocess_args(dev_id, tup, False)[0]
-
     # Check if the input is not an empty sequence
     if len(arrays) == 0:
         raise ValueError('Cannot concatenate from empty tuple')
 
-    # Check types of the input arrays
-    for o in arrays:
-        if not isinstance(o, _ndarray_base):
-            raise TypeError('Only cupy arrays can be concatenated')
-
-    # Check ndim > 0 for the input arrays
-    for o in arrays:
-        a = o
+    # Check types and ndim > 0 of the input arrays in one pass.  Objects
+    # exposing __cuda_array_interface__ (Numba, PyTorch, ...) are adopted
+    # zero-copy instead of being rejected.
+    for i in range(len(arrays)):
+        o = arrays[i]
+        if isinstance(o, _ndarray_base):
+            a = o
+        else:
+            a = core._convert_from_cupy_like(o, False)
+            if a is None:
+                raise TypeError('Only cupy arrays can be concatenated')
+            arrays[i] = a
         if a._shape.size() == 0:
             raise TypeError('zero-dimensional arrays cannot be concatenated')
 
-    # Check ndim consistency of the input arrays
+    # Check ndim/shape consistency, compute the output shape and record
+    # dtype uniformity in one indexed pass; the comparisons run on the
+    # C-level shape vectors, with no list slices or tuple comparisons.
     a0 = arrays[0]
     ndim0 = a0._shape.size()
-    for o in arrays[1:]:
-        a = o
+    axis = internal._normalize_axis_index(axis, ndim0)
+    shape0 = a0._shape
+    dtype0 = a0.dtype
+    have_same_types = True
+    for k in range(1, len(arrays)):
+        a = arrays[k]
         if <int>(a._shape.size()) != ndim0:
             raise ValueError(
                 'All arrays to concatenate must have the same ndim')
-
-    # Check shape consistency of the input arrays, and compute the output shape
-    shape0 = a0._shape
-    axis = internal._normalize_axis_index(axis, ndim0)
-    for o in arrays[1:]:
-        a = o
         for i in range(ndim0):
             if i != axis and shape0[i] != a._shape[i]:
                 raise ValueError(
                     'All arrays must have same shape except the axis to '
                     'concatenate')
         shape0[axis] += a._shape[axis]
+        if have_same_types:
+            have_same_types = a.dtype == dtype0
 
     # Compute the output dtype
     if out is None:
         if dtype is None:
-            dtype = a0.dtype
-            have_same_types = True
-            for o in arrays[1:]:
-                have_same_types = have_same_types and (o.dtype == dtype)
-            if not have_same_types:
+            if have_same_types:
+                dtype = dtype0
+            else:
                 dtype = functools.reduce(
                     numpy.promote_types, set([a.dtype for a in arrays]))
     else:
@@ -648,9 +821,34 @@ cpdef _ndarray_base concatenate_method(
                             'argument, but both were provided.')
         dtype = out.dtype
 
-    # Check casting rule
+    # Check casting rule; a matching dtype never needs the (Python-level)
+    # can-cast machinery.  The cast itself is fused into the per-input
+    # copy kernel by elementwise_copy, so no temporary is materialized.
+    for o in arrays:
+        if o.dtype != dtype:
+            _raise_if_invalid_cast(o.dtype, dtype, casting)
+
+    # Inputs that are empty along the concat axis contribute nothing;
+    # drop them so no copy kernel is scheduled for zero-size slabs.
     for o in arrays:
-        _raise_if_invalid_cast(o.dtype, dtype, casting)
+        a = o
+        if a._shape[axis] == 0:
+            filtered = []
+            for o in arrays:
+                a = o
+                if a._shape[axis] != 0:
+                    filtered.append(o)
+            arrays = filtered
+            break
+
+    # A single remaining input needs neither a copy kernel nor an
+    # allocation.  Callers that promise a fresh array to their own
+    # callers (e.g. the nested-sequence path of ``cupy.array``) pass
+    # ``always_copy`` to opt out of the view shortcut.
+    if out is None and not always_copy and len(arrays) == 1:
+        a = arrays[0]
+        if a.dtype == dtype:
+            return a
 
     # Prpare the output array
     shape_t = tuple(shape0)
@@ -676,7 +874,10 @@ cpdef _ndarray_base _concatenate(
 
     dtype = out.dtype
 
-    if len(arrays) > 8:
+    # The single-kernel path pays off as soon as more than two launches
+    # would be replaced; stack() always produces the uniform-shape case
+    # that the specialized kernel handles best.
+    if len(arrays) > 2:
         all_same_type = True
         same_shape_and_contiguous = True
         axis_size = shape[axis] // len(arrays)
@@ -695,17 +896,31 @@ cpdef _ndarray_base _concatenate(
             return _concatenate_single_kernel(
                 arrays, axis, shape, dtype, same_shape_and_contiguous, out)
 
+    # Few-input fallback (the hstack((a, b)) common case): one slab copy
+    # per input, with the destination views built directly instead of
+    # going through ndarray.__getitem__'s slice parsing.
     i = 0
-    slice_list = [slice(None)] * len(shape)
     for a in arrays:
         aw = a._shape[axis]
-        slice_list[axis] = slice(i, i + aw)
-        b = out[tuple(slice_list)]
+        b = _axis_slab_view(out, axis, i, aw)
         elementwise_copy(a, b, casting=casting)
         i += aw
     return out
 
 
+cdef _ndarray_base _axis_slab_view(
+        _ndarray_base out, Py_ssize_t axis, Py_ssize_t start,
+        Py_ssize_t width):
+    cdef shape_t shape = out._shape
+    cdef _ndarray_base v
+    shape[axis] = width
+    v = out.view()
+    if start > 0 and out.size != 0:
+        v.data = out.data + start * out._strides[axis]
+    v._set_shape_and_strides(shape, out._strides, True, True)
+    return v
+
+
 cpdef Py_ssize_t size(_ndarray_base a, axis=None) except? -1:
     """Returns the number of elements along a given axis.
 
@@ -798,39 +1013,43 @@ cdef _normalize_axis_tuple(axis, Py_ssize_t ndim, shape_t &ret):
 cdef _ndarray_base _concatenate_single_kernel(
         list arrays, Py_ssize_t axis, tuple shape, dtype,
         bint same_shape_and_contiguous, _ndarray_base out):
-    cdef _ndarray_base a, x
-    cdef Py_ssize_t base, cum, ndim
+    cdef _ndarray_base a, d_meta
+    cdef Py_ssize_t base, cum, ndim, n
     cdef int i, j
     cdef Py_ssize_t[:] ptrs
-    cdef Py_ssize_t[:] cum_sizes
-    cdef Py_ssize_t[:, :] x_strides
+    cdef Py_ssize_t[:] meta
     cdef int device_id = device.get_device_id()
 
     assert out is not None
 
-    ptrs = numpy.ndarray(len(arrays), numpy.int64)
-    for i, a in enumerate(arrays):
-        _check_peer_access(a, device_id)
-        ptrs[i] = a.data.ptr
-    x = core.array(ptrs)
+    n = len(arrays)
 
     if same_shape_and_contiguous:
-        base = internal.prod_sequence(shape[axis:]) // len(arrays)
-        _concatenate_kernel_same_size(x, base, out)
+        ptrs = numpy.ndarray(n, numpy.int64)
+        for i, a in enumerate(arrays):
+            _check_peer_access(a, device_id)
+            ptrs[i] = a.data.ptr
+        base = internal.prod_sequence(shape[axis:]) // n
+        _concatenate_kernel_same_size(core.array(ptrs), base, out)
         return out
 
+    # Pack pointers, cumulative sizes and strides into one SoA buffer so
+    # the host metadata reaches the device in a single transfer.
     ndim = len(shape)
-    x_strides = numpy.ndarray((len(arrays), ndim), numpy.int64)
-    cum_sizes = numpy.ndarray(len(arrays), numpy.int64)
+    meta = numpy.ndarray(2 * n + n * ndim, numpy.int64)
     cum = 0
     for i, a in enumerate(arrays):
-        for j in range(ndim):
-            x_strides[i, j] = <int>a._strides[j]
-        cum_sizes[i] = cum
+        _check_peer_access(a, device_id)
+        meta[i] = a.data.ptr
+        meta[n + i] = cum
         cum += <int>a._shape[axis]
+        for j in range(ndim):
+            meta[2 * n + i * ndim + j] = a._strides[j]
 
+    d_meta = core.array(meta)
     _concatenate_kernel(
-        x, axis, core.array(cum_sizes), core.array(x_strides), out)
+        d_meta[:n], axis, d_meta[n:2 * n],
+        d_meta[2 * n:].reshape(n, ndim), out)
     return out
 
 
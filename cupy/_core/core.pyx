@@ -2721,7 +2721,10 @@ cdef _ndarray_base _array_from_nested_cupy_sequence(
     lst = []
     _flatten_into_list_and_ensure_1d(obj, lst)
 
-    a = _manipulation.concatenate_method(lst, 0)
+    # ``always_copy`` keeps the copy contract of ``array``: the
+    # single-input view shortcut of concatenate would otherwise let the
+    # reshape/astype below return views aliasing the caller's array.
+    a = _manipulation.concatenate_method(lst, 0, always_copy=True)
     a = a.reshape(shape)
     a = a.astype(dtype, order=order, copy=False)
 
@@ -146,7 +146,9 @@ def expand_dims(a, axis):
 
     """
     if type(axis) not in (tuple, list):
-        axis = axis,
+        # Inserting a single axis is always a direct view; skip the
+        # generic reshape path.
+        return _manipulation._insert_axis(a, axis)
     return _manipulation._expand_dims(a, axis)
 
 
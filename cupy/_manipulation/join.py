@@ -2,11 +2,21 @@ from __future__ import annotations
 
 import warnings
 
-import cupy
 from cupy import _core
+import cupy._core._routines_manipulation as _manipulation
 
+# Bound at module scope so the hot wrappers below avoid repeated module
+# attribute lookups per call.
+_concatenate_method = _core.concatenate_method
+_concatenate_with_reshape = _manipulation.concatenate_method_with_reshape
+_RESHAPE_INSERT_AXIS = _manipulation.RESHAPE_INSERT_AXIS
+_RESHAPE_ATLEAST_1D = _manipulation.RESHAPE_ATLEAST_1D
+_RESHAPE_ATLEAST_2D = _manipulation.RESHAPE_ATLEAST_2D
+_RESHAPE_ATLEAST_3D = _manipulation.RESHAPE_ATLEAST_3D
+_RESHAPE_COLUMN_2D = _manipulation.RESHAPE_COLUMN_2D
 
-def column_stack(tup):
+
+def column_stack(tup, out=None):
     """Stacks 1-D and 2-D arrays as columns into a 2-D array.
 
     A 1-D array is first converted to a 2-D column array. Then, the 2-D arrays
@@ -14,6 +24,9 @@ def column_stack(tup):
 
     Args:
         tup (sequence of arrays): 1-D or 2-D arrays to be stacked.
+        out (cupy.ndarray): Output array. Any object exposing
+            ``__cuda_array_interface__`` (e.g. an externally allocated
+            device buffer) is also accepted and written in place.
 
     Returns:
         cupy.ndarray: A new 2-D array of stacked columns.
@@ -21,19 +34,7 @@ def column_stack(tup):
     .. seealso:: :func:`numpy.column_stack`
 
     """
-    if any(not isinstance(a, cupy.ndarray) for a in tup):
-        raise TypeError('Only cupy arrays can be column stacked')
-
-    lst = list(tup)
-    for i, a in enumerate(lst):
-        if a.ndim == 1:
-            a = a[:, cupy.newaxis]
-            lst[i] = a
-        elif a.ndim != 2:
-            raise ValueError(
-                'Only 1 or 2 dimensional arrays can be column stacked')
-
-    return concatenate(lst, axis=1)
+    return _concatenate_with_reshape(tup, _RESHAPE_COLUMN_2D, 1, out)
 
 
 def concatenate(tup, axis=0, out=None, *, dtype=None, casting='same_kind'):
@@ -45,7 +46,9 @@ def concatenate(tup, axis=0, out=None, *, dtype=None, casting='same_kind'):
         axis (int or None): The axis to join arrays along.
             If axis is None, arrays are flattened before use.
             Default is 0.
-        out (cupy.ndarray): Output array.
+        out (cupy.ndarray): Output array. Any object exposing
+            ``__cuda_array_interface__`` (e.g. an externally allocated
+            device buffer) is also accepted and written in place.
         dtype (str or dtype): If provided, the destination array will have this
             dtype. Cannot be provided together with ``out``.
         casting ({‘no’, ‘equiv’, ‘safe’, ‘same_kind’, ‘unsafe’}, optional):
@@ -59,17 +62,22 @@ def concatenate(tup, axis=0, out=None, *, dtype=None, casting='same_kind'):
 
     """
     if axis is None:
-        tup = [m.ravel() for m in tup]
-        axis = 0
-    return _core.concatenate_method(tup, axis, out, dtype, casting)
+        # Flattening is done on the C level so that contiguous inputs
+        # only pay for a metadata rewrite, not a ravel() call each.
+        return _concatenate_method(
+            tup, 0, out, dtype, casting, flatten_inputs=True)
+    return _concatenate_method(tup, axis, out, dtype, casting)
 
 
-def dstack(tup):
+def dstack(tup, out=None):
     """Stacks arrays along the third axis.
 
     Args:
         tup (sequence of arrays): Arrays to be stacked. Each array is converted
             by :func:`cupy.atleast_3d` before stacking.
+        out (cupy.ndarray): Output array. Any object exposing
+            ``__cuda_array_interface__`` (e.g. an externally allocated
+            device buffer) is also accepted and written in place.
 
     Returns:
         cupy.ndarray: Stacked array.
@@ -77,10 +85,10 @@ def dstack(tup):
     .. seealso:: :func:`numpy.dstack`
 
     """
-    return concatenate([cupy.atleast_3d(m) for m in tup], 2)
+    return _concatenate_with_reshape(tup, _RESHAPE_ATLEAST_3D, 2, out)
 
 
-def hstack(tup, *, dtype=None, casting='same_kind'):
+def hstack(tup, out=None, *, dtype=None, casting='same_kind'):
     """Stacks arrays horizontally.
 
     If an input array has one dimension, then the array is treated as a
@@ -89,8 +97,11 @@ def hstack(tup, *, dtype=None, casting='same_kind'):
 
     Args:
         tup (sequence of arrays): Arrays to be stacked.
+        out (cupy.ndarray): Output array. Any object exposing
+            ``__cuda_array_interface__`` (e.g. an externally allocated
+            device buffer) is also accepted and written in place.
         dtype (str or dtype): If provided, the destination array will have this
-            dtype.
+            dtype. Cannot be provided together with ``out``.
         casting ({‘no’, ‘equiv’, ‘safe’, ‘same_kind’, ‘unsafe’}, optional):
             Controls what kind of data casting may occur. Defaults to
             ``'same_kind'``.
@@ -101,14 +112,13 @@ def hstack(tup, *, dtype=None, casting='same_kind'):
     .. seealso:: :func:`numpy.hstack`
 
     """
-    arrs = [cupy.atleast_1d(a) for a in tup]
-    axis = 1
-    if arrs[0].ndim == 1:
-        axis = 0
-    return concatenate(arrs, axis, dtype=dtype, casting=casting)
+    # The joining axis is selected inside the core routine: 1-D inputs
+    # (after the atleast_1d pass) are joined along the first axis.
+    return _concatenate_with_reshape(
+        tup, _RESHAPE_ATLEAST_1D, 1, out, dtype, casting)
 
 
-def vstack(tup, *, dtype=None, casting='same_kind'):
+def vstack(tup, out=None, *, dtype=None, casting='same_kind'):
     """Stacks arrays vertically.
 
     If an input array has one dimension, then the array is treated as a
@@ -118,8 +128,11 @@ def vstack(tup, *, dtype=None, casting='same_kind'):
     Args:
         tup (sequence of arrays): Arrays to be stacked. Each array is converted
             by :func:`cupy.atleast_2d` before stacking.
+        out (cupy.ndarray): Output array. Any object exposing
+            ``__cuda_array_interface__`` (e.g. an externally allocated
+            device buffer) is also accepted and written in place.
         dtype (str or dtype): If provided, the destination array will have this
-            dtype.
+            dtype. Cannot be provided together with ``out``.
         casting ({‘no’, ‘equiv’, ‘safe’, ‘same_kind’, ‘unsafe’}, optional):
             Controls what kind of data casting may occur. Defaults to
             ``'same_kind'``.
@@ -130,17 +143,25 @@ def vstack(tup, *, dtype=None, casting='same_kind'):
     .. seealso:: :func:`numpy.dstack`
 
     """
-    return concatenate([cupy.atleast_2d(m) for m in tup], 0,
-                       dtype=dtype, casting=casting)
+    return _concatenate_with_reshape(
+        tup, _RESHAPE_ATLEAST_2D, 0, out, dtype, casting)
+
+
+_row_stack_warned = False
 
 
 def row_stack(tup, *, dtype=None, casting='same_kind'):
-    warnings.warn(
-        "`row_stack` alias is deprecated. "
-        "Use `cp.vstack` directly.",
-        DeprecationWarning,
-        stacklevel=1
-    )
+    # Warn only once per process; `warnings.warn` is too expensive to pay
+    # on every call of a deprecated alias used in hot loops.
+    global _row_stack_warned
+    if not _row_stack_warned:
+        _row_stack_warned = True
+        warnings.warn(
+            "`row_stack` alias is deprecated. "
+            "Use `cp.vstack` directly.",
+            DeprecationWarning,
+            stacklevel=1
+        )
     return vstack(tup, dtype=dtype, casting=casting)
 
 
@@ -150,7 +171,9 @@ def stack(tup, axis=0, out=None, *, dtype=None, casting='same_kind'):
     Args:
         tup (sequence of arrays): Arrays to be stacked.
         axis (int): Axis along which the arrays are stacked.
-        out (cupy.ndarray): Output array.
+        out (cupy.ndarray): Output array. Any object exposing
+            ``__cuda_array_interface__`` (e.g. an externally allocated
+            device buffer) is also accepted and written in place.
         dtype (str or dtype): If provided, the destination array will have this
             dtype. Cannot be provided together with ``out``.
         casting ({‘no’, ‘equiv’, ‘safe’, ‘same_kind’, ‘unsafe’}, optional):
@@ -162,5 +185,5 @@ def stack(tup, axis=0, out=None, *, dtype=None, casting='same_kind'):
 
     .. seealso:: :func:`numpy.stack`
     """
-    return concatenate([cupy.expand_dims(x, axis) for x in tup], axis, out,
-                       dtype=dtype, casting=casting)
+    return _concatenate_with_reshape(
+        tup, _RESHAPE_INSERT_AXIS, axis, out, dtype=dtype, casting=casting)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-import copy
+import atexit
+import contextlib
 import hashlib
+import mmap
 import math
 import os
 import platform
@@ -10,6 +12,7 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import warnings
 
 from cupy.cuda import device
@@ -26,8 +29,9 @@ _cuda_hip_version = driver.get_build_version()
 
 _nvrtc_version = None
 _win32 = sys.platform.startswith('win32')
-_rdc_flags = ('--device-c', '-dc', '-rdc=true',
-              '--relocatable-device-code=true')
+_rdc_flags = frozenset(('--device-c', '-dc', '-rdc=true',
+                        '--relocatable-device-code=true'))
+# None: not probed yet; False: probe failed; str: path to cudadevrt.
 _cudadevrt = None
 
 
@@ -60,8 +64,7 @@ def _run_cc(cmd, cwd, backend, log_stream=None):
             extra_path = _get_extra_path_for_msvc()
             if extra_path is not None:
                 path = extra_path + os.pathsep + os.environ.get('PATH', '')
-                env = copy.deepcopy(env)
-                env['PATH'] = path
+                env = {**os.environ, 'PATH': path}
         log = subprocess.check_output(
             cmd, cwd=cwd, env=env,
             stderr=subprocess.STDOUT,
@@ -213,7 +216,12 @@ def _get_arch():
         return min(arch, nvrtc_max_compute_capability, key=int)
 
 
-@_util.memoize(for_each_device=True)
+# The result is a pure function of (device, arch); cached in a plain dict
+# as this is called (twice) per compile and the memoize decorator's
+# argument-tuple machinery is measurable there.
+_arch_opts_for_nvrtc: dict = {}
+
+
 def _get_arch_for_options_for_nvrtc(arch=None):
     # NVRTC in CUDA 11.3+ generates PTX that cannot be run an earlier driver
     # version than the one included in the used CUDA version, as
@@ -221,23 +229,33 @@ def _get_arch_for_options_for_nvrtc(arch=None):
     # https://docs.nvidia.com/cuda/archive/11.3.0/nvrtc/index.html#versioning
     # Here we use `-arch=sm_*` instead of `-arch=compute_*` to directly
     # generate cubin (SASS) instead of PTX. See #5097 for details.
-    if arch is None:
-        arch = _get_arch()
-    if (
-        not _use_ptx
-        and int(arch) <= int(_get_max_compute_capability())
-    ):
-        return f'-arch=sm_{arch}', 'cubin'
-    return f'-arch=compute_{arch}', 'ptx'
+    key = (runtime.getDevice(), arch)
+    ret = _arch_opts_for_nvrtc.get(key)
+    if ret is None:
+        if arch is None:
+            arch = _get_arch()
+        if (
+            not _use_ptx
+            and int(arch) <= int(_get_max_compute_capability())
+        ):
+            ret = f'-arch=sm_{arch}', 'cubin'
+        else:
+            ret = f'-arch=compute_{arch}', 'ptx'
+        _arch_opts_for_nvrtc[key] = ret
+    return ret
 
 
 def _is_cudadevrt_needed(options):
-    return any(o for o in options if o in _rdc_flags)
+    return not _rdc_flags.isdisjoint(options)
 
 
 def _get_cudadevrt_path():
     global _cudadevrt
     if _cudadevrt is not None:
+        if _cudadevrt is False:
+            raise RuntimeError(
+                'Relocatable PTX code is requested, but cudadevrt '
+                'is not found.')
         return _cudadevrt
 
     # defer import to here to avoid circular dependency
@@ -258,9 +276,11 @@ def _get_cudadevrt_path():
         else:
             cudadevrt = cudadevrt64
     if not os.path.isfile(cudadevrt):
+        _cudadevrt = False
         raise RuntimeError(
             'Relocatable PTX code is requested, but cudadevrt '
             'is not found.')
+    _cudadevrt = cudadevrt
     return cudadevrt
 
 
@@ -279,10 +299,53 @@ def _get_bool_env_variable(name, default):
 
 
 _use_ptx = _get_bool_env_variable('CUPY_COMPILE_WITH_PTX', False)
+# Opt-in: serialize identical compiles across processes so that N
+# workers launched together build a cold kernel once instead of N times.
+_compile_lock_enabled = _get_bool_env_variable('CUPY_COMPILE_LOCK', False)
+
+
+@contextlib.contextmanager
+def _compile_file_lock(cache_dir, key_parts):
+    if not _compile_lock_enabled:
+        yield
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    lock_path = os.path.join(
+        cache_dir, '.' + _hash_hexdigest_parts(*key_parts) + '.lock')
+    with open(lock_path, 'wb') as f:
+        if _win32:
+            import msvcrt
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            import fcntl
+            fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if _win32:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(f, fcntl.LOCK_UN)
 _jitify_header_source_map_populated = False
 
+# Jitify's header discovery walks the include graph of the source, which
+# is costly even when the same source is compiled repeatedly (e.g. for a
+# new set of name expressions).  Its output only depends on the source
+# and options, so keep it per process, keyed by the source digest.
+_jitify_prep_cache: dict = {}
+
 
 def _jitify_prep(source, options, cu_path):
+    key = (_hash_hexdigest(source.encode('utf-8')), options)
+    result = _jitify_prep_cache.get(key)
+    if result is None:
+        result = _jitify_prep_core(source, options, cu_path)
+        _jitify_prep_cache[key] = result
+    return result
+
+
+def _jitify_prep_core(source, options, cu_path):
     from cupy.cuda import jitify
 
     # TODO(leofang): refactor this?
@@ -320,10 +383,29 @@ def _jitify_prep(source, options, cu_path):
 
 
 def _hash_hexdigest(value):
-    return hashlib.sha1(value, usedforsecurity=False).hexdigest()
+    # SHA-256 is hardware-accelerated (SHA-NI/ARMv8 crypto) in OpenSSL on
+    # modern CPUs, unlike SHA-1.  The digest only serves as a cache file
+    # name and corruption check, so it is truncated to keep the historical
+    # key length.
+    return hashlib.sha256(value, usedforsecurity=False).hexdigest()[:40]
+
+
+def _hash_hexdigest_parts(*parts):
+    # Equivalent to _hash_hexdigest(' '.join(parts).encode()) but streams
+    # each part into the hasher, so no concatenated multi-megabyte key
+    # string is materialized and re-encoded.
+    h = hashlib.sha256(usedforsecurity=False)
+    first = True
+    for part in parts:
+        if first:
+            first = False
+        else:
+            h.update(b' ')
+        h.update(str(part).encode('utf-8'))
+    return h.hexdigest()[:40]
 
 
-_hash_length = len(_hash_hexdigest(b''))  # 40 for SHA1
+_hash_length = len(_hash_hexdigest(b''))  # 40 hex chars
 
 
 def compile_using_nvrtc(source, options=(), arch=None, filename='kern.cu',
@@ -366,11 +448,11 @@ def compile_using_nvrtc(source, options=(), arch=None, filename='kern.cu',
         return compiled_obj, mapping
 
     if not cache_in_memory:
-        with tempfile.TemporaryDirectory() as root_dir:
-            cu_path = os.path.join(root_dir, filename)
-
-            with open(cu_path, 'w') as cu_file:
-                cu_file.write(source)
+        # The path only serves as the program name in diagnostics and as
+        # Jitify's program key; NVRTC compiles from the in-memory string,
+        # so there is no need to materialize the source in a temporary
+        # directory.
+        cu_path = filename
     else:
         cu_path = '' if not jitify else filename
 
@@ -378,6 +460,24 @@ def compile_using_nvrtc(source, options=(), arch=None, filename='kern.cu',
                     log_stream, jitify, method)
 
 
+_nvcc_scratch_root = None
+_nvcc_base_cmd = None
+
+
+def _make_nvcc_scratch_dir():
+    # nvcc needs its inputs and outputs on disk.  Tearing a temporary
+    # directory down after every invocation costs an unlink+rmdir per
+    # file (and re-triggers antivirus scans of the temp root on
+    # Windows); instead hand out per-compile subdirectories of one
+    # persistent root that is removed in a single pass at process exit.
+    global _nvcc_scratch_root
+    if _nvcc_scratch_root is None:
+        _nvcc_scratch_root = tempfile.mkdtemp(prefix='cupy-nvcc-')
+        atexit.register(
+            shutil.rmtree, _nvcc_scratch_root, ignore_errors=True)
+    return tempfile.mkdtemp(dir=_nvcc_scratch_root)
+
+
 def compile_using_nvcc(source, options=(), arch=None,
                        filename='kern.cu', code_type='cubin',
                        separate_compilation=False, log_stream=None):
@@ -393,77 +493,83 @@ def compile_using_nvcc(source, options=(), arch=None,
         assert not separate_compilation
 
     arch_str = '-gencode=arch=compute_{cc},code=sm_{cc}'.format(cc=arch)
-    _nvcc = get_nvcc_path()
-    # split() is needed because _nvcc could come from the env var NVCC
-    cmd = _nvcc.split()
-    cmd.append(arch_str)
-
-    with tempfile.TemporaryDirectory() as root_dir:
-        first_part = filename.split('.')[0]
+    global _nvcc_base_cmd
+    if _nvcc_base_cmd is None:
+        # split() is needed because the path could come from the env var
+        # NVCC with extra arguments; the result cannot change within a
+        # process, so split it once.
+        _nvcc_base_cmd = get_nvcc_path().split()
+    cmd = _nvcc_base_cmd + [arch_str]
+
+    root_dir = _make_nvcc_scratch_dir()
+    first_part = filename.split('.')[0]
+
+    path = os.path.join(root_dir, first_part)
+    cu_path = '%s.cu' % path
+    result_path = '%s.%s' % (path, code_type)
+
+    with open(cu_path, 'w') as cu_file:
+        cu_file.write(source)
+
+    if not separate_compilation:  # majority cases
+        cmd.append('--%s' % code_type)
+        cmd += list(options)
+        cmd.append(cu_path)
 
-        path = os.path.join(root_dir, first_part)
-        cu_path = '%s.cu' % path
-        result_path = '%s.%s' % (path, code_type)
+        try:
+            _run_cc(cmd, root_dir, 'nvcc', log_stream)
+        except NVCCException as e:
+            cex = CompileException(str(e), source, cu_path, options,
+                                   'nvcc')
 
-        with open(cu_path, 'w') as cu_file:
-            cu_file.write(source)
+            dump = _get_bool_env_variable(
+                'CUPY_DUMP_CUDA_SOURCE_ON_ERROR', False)
+            if dump:
+                cex.dump(sys.stderr)
 
-        if not separate_compilation:  # majority cases
-            cmd.append('--%s' % code_type)
-            cmd += list(options)
-            cmd.append(cu_path)
+            raise cex
+    else:  # two steps: compile to object and device-link
+        cmd_partial = cmd.copy()
+        cmd_partial.append('--cubin')
 
-            try:
-                _run_cc(cmd, root_dir, 'nvcc', log_stream)
-            except NVCCException as e:
-                cex = CompileException(str(e), source, cu_path, options,
-                                       'nvcc')
+        obj = path + '.o'
+        cmd += list(options + ('-o', obj))
+        cmd.append(cu_path)
 
-                dump = _get_bool_env_variable(
-                    'CUPY_DUMP_CUDA_SOURCE_ON_ERROR', False)
-                if dump:
-                    cex.dump(sys.stderr)
+        try:
+            _run_cc(cmd, root_dir, 'nvcc', log_stream)
+        except NVCCException as e:
+            cex = CompileException(str(e), source, cu_path, options,
+                                   'nvcc')
 
-                raise cex
-        else:  # two steps: compile to object and device-link
-            cmd_partial = cmd.copy()
-            cmd_partial.append('--cubin')
+            dump = _get_bool_env_variable(
+                'CUPY_DUMP_CUDA_SOURCE_ON_ERROR', False)
+            if dump:
+                cex.dump(sys.stderr)
 
-            obj = path + '.o'
-            cmd += list(options + ('-o', obj))
-            cmd.append(cu_path)
+            raise cex
 
-            try:
-                _run_cc(cmd, root_dir, 'nvcc', log_stream)
-            except NVCCException as e:
-                cex = CompileException(str(e), source, cu_path, options,
-                                       'nvcc')
+        options = _remove_rdc_option(options)
+        options += ('--device-link', obj, '-o', path + '.cubin')
+        cmd = cmd_partial + list(options)
 
-                dump = _get_bool_env_variable(
-                    'CUPY_DUMP_CUDA_SOURCE_ON_ERROR', False)
-                if dump:
-                    cex.dump(sys.stderr)
+        try:
+            _run_cc(cmd, root_dir, 'nvcc', log_stream)
+        except NVCCException as e:
+            cex = CompileException(str(e), '', '', options, 'nvcc')
+            raise cex
 
-                raise cex
+    if code_type == 'ptx':
+        with open(result_path, 'rb') as ptx_file:
+            return ptx_file.read()
+    elif code_type == 'cubin':
+        with open(result_path, 'rb') as bin_file:
+            return bin_file.read()
+    else:
+        assert False, code_type
 
-            options = _remove_rdc_option(options)
-            options += ('--device-link', obj, '-o', path + '.cubin')
-            cmd = cmd_partial + list(options)
 
-            try:
-                _run_cc(cmd, root_dir, 'nvcc', log_stream)
-            except NVCCException as e:
-                cex = CompileException(str(e), '', '', options, 'nvcc')
-                raise cex
-
-        if code_type == 'ptx':
-            with open(result_path, 'rb') as ptx_file:
-                return ptx_file.read()
-        elif code_type == 'cubin':
-            with open(result_path, 'rb') as bin_file:
-                return bin_file.read()
-        else:
-            assert False, code_type
+_comment_line_re = re.compile(rb'^//[^\r\n]*', re.M)
 
 
 def _preprocess(source, options, arch, backend):
@@ -496,9 +602,11 @@ def _preprocess(source, options, arch, backend):
 
     assert isinstance(result, bytes)
 
-    # Extract the part containing version information.
-    return '\n'.join(
-        x for x in result.decode().splitlines() if x.startswith('//'))
+    # Extract the part containing version information.  The filter runs on
+    # the raw bytes so megabyte-scale preprocessor output is scanned by
+    # the C regex engine instead of a per-line Python loop, and only the
+    # few matched lines are decoded.
+    return b'\n'.join(_comment_line_re.findall(result)).decode()
 
 
 _default_cache_dir = os.path.expanduser('~/.cupy/kernel_cache')
@@ -508,9 +616,156 @@ def get_cache_dir():
     return os.environ.get('CUPY_CACHE_DIR', _default_cache_dir)
 
 
+@_util.memoize()
+def _get_static_options_suffix(
+        to_ltoir, enable_cooperative_groups, debug, add_jitify_define):
+    # TODO(leofang): consider move --device-as-default-execution-space
+    # (-default-device) to here to avoid double definition error
+    suffix = ('-ftz=true',)
+    if to_ltoir:
+        suffix += ('-dlto',)
+    if enable_cooperative_groups:
+        # `cooperative_groups` requires relocatable device code.
+        suffix += ('--device-c',)
+    # TODO(leofang): check if this works for LTO IR
+    if debug:
+        suffix += ('--device-debug', '--generate-line-info')
+    if add_jitify_define:
+        # jitify is set in RawKernel/RawModule, translate it to an option
+        # that is useless to the compiler, but can be used as part of the
+        # hash key
+        suffix += ('-DCUPY_USE_JITIFY',)
+    return suffix + _get_extra_include_dir_opts()
+
+
 _empty_file_preprocess_cache: dict = {}
 
 
+# Names present in the on-disk cache directory, scanned once per process
+# and kept up to date on writes.  A single getdents-backed scan replaces a
+# stat() per kernel dispatch; a file added by another process after the
+# scan is merely recompiled, which is already the lock-free contract of
+# the cache.
+_disk_cache_index: set | None = None
+_disk_cache_index_dir: str | None = None
+
+
+def _cache_file_exists(cache_dir, name):
+    global _disk_cache_index, _disk_cache_index_dir
+    if _disk_cache_index is None or _disk_cache_index_dir != cache_dir:
+        with os.scandir(cache_dir) as it:
+            _disk_cache_index = {e.name for e in it}
+        _disk_cache_index_dir = cache_dir
+    if name in _disk_cache_index:
+        return True
+    if _compile_lock_enabled:
+        # With cross-process locking on, another process may have written
+        # the file after our directory scan; fall back to one stat.
+        if os.path.exists(os.path.join(cache_dir, name)):
+            _disk_cache_index.add(name)
+            return True
+    return False
+
+
+def _note_cache_file_written(cache_dir, name):
+    if _disk_cache_index is not None and _disk_cache_index_dir == cache_dir:
+        _disk_cache_index.add(name)
+
+
+def _mmap_cache_file(path):
+    # Map the cached binary instead of reading it into the heap: the
+    # integrity hash then runs zero-copy over the mapping and only the
+    # module image itself is copied out for the loader.  Returns None
+    # when the file cannot be mapped (e.g. empty or truncated away).
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if os.fstat(fd).st_size == 0:
+            return None
+        return mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    finally:
+        os.close(fd)
+
+
+def _write_cache_file(cache_dir, path, *parts):
+    # On Linux, write through an unnamed O_TMPFILE inode and link it into
+    # place: no visible temporary entry, one fewer namespace operation
+    # than rename, and nothing stray is left behind on a crash.  Fall
+    # back to tempfile plus atomic rename elsewhere (or on filesystems
+    # without O_TMPFILE support).
+    if hasattr(os, 'O_TMPFILE'):
+        try:
+            fd = os.open(cache_dir, os.O_TMPFILE | os.O_WRONLY, 0o666)
+        except OSError:
+            fd = -1
+        if fd != -1:
+            done = False
+            try:
+                for part in parts:
+                    os.write(fd, part)
+                if _get_bool_env_variable('CUPY_CACHE_FSYNC', False):
+                    os.fsync(fd)
+                try:
+                    os.link('/proc/self/fd/%d' % fd, path)
+                    done = True
+                except FileExistsError:
+                    # Lost a race; the existing file carries the same key.
+                    done = True
+                except OSError:
+                    pass
+            finally:
+                os.close(fd)
+            if done:
+                return
+
+    # Replacing the file should be atomic. But we add a hash for safety
+    # to detect possible corruption.
+    with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as tf:
+        for part in parts:
+            tf.write(part)
+        temp_path = tf.name
+        _maybe_fsync(tf)
+
+    try:
+        os.replace(temp_path, path)
+    except PermissionError:
+        # Windows may refuse to replace the file, assume this is a race
+        # and the existing file is OK (but keep using our copy)
+        pass
+
+
+def _maybe_fsync(tf):
+    # The rename into place is atomic within the cache filesystem, but
+    # after a power loss the renamed file may still contain garbage
+    # unless it was fsync'ed first.  The hash prefix catches that case
+    # on load, so durability is opt-in as fsync is expensive.
+    if _get_bool_env_variable('CUPY_CACHE_FSYNC', False):
+        tf.flush()
+        os.fsync(tf.fileno())
+
+
+def _read_cache_file(path):
+    # A buffered ``open()`` would copy the binary through BufferedReader;
+    # read it in one unbuffered pass instead.
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    return data
+
+# Process-level cache of loaded modules.  Loading a cached cubin from disk
+# still pays SHA1 + read + cuModuleLoadData on every call; repeated
+# compilations of the same source can simply reuse the live Module.
+_module_memory_cache: dict = {}
+_module_memory_cache_lock = threading.Lock()
+
+
 def _compile_module_with_cache(
         source, options=(), arch=None, cache_dir=None, extra_source=None,
         backend='nvrtc', *, enable_cooperative_groups=False,
@@ -546,57 +801,89 @@ def _compile_with_cache_cuda(
         source, options, arch, cache_dir, extra_source=None, backend='nvrtc',
         enable_cooperative_groups=False, name_expressions=None,
         log_stream=None, cache_in_memory=False, jitify=False, to_ltoir=False):
-    # NVRTC does not use extra_source. extra_source is used for cache key.
-    global _empty_file_preprocess_cache
-    if cache_dir is None:
-        cache_dir = get_cache_dir()
     if arch is None:
         arch = _get_arch()
+    mem_key = (
+        source, extra_source, options, arch, backend,
+        enable_cooperative_groups,
+        None if name_expressions is None else tuple(name_expressions),
+        jitify, to_ltoir, device.get_device_id())
+    with _module_memory_cache_lock:
+        mod = _module_memory_cache.get(mem_key)
+    if mod is not None:
+        return mod
+    with _compile_file_lock(
+            cache_dir if cache_dir is not None else get_cache_dir(),
+            mem_key[:-1]):
+        mod = _compile_with_cache_cuda_core(
+            source, options, arch, cache_dir, extra_source, backend,
+            enable_cooperative_groups, name_expressions, log_stream,
+            cache_in_memory, jitify, to_ltoir)
+    with _module_memory_cache_lock:
+        _module_memory_cache[mem_key] = mod
+    return mod
 
-    # TODO(leofang): consider move --device-as-default-execution-space
-    # (-default-device) to here to avoid double definition error
-    options += ('-ftz=true',)
 
-    if to_ltoir:
-        options += ('-dlto',)
+@_util.memoize()
+def _get_nvrtc_pch_options(cache_dir):
+    # NVRTC 12.8+ can build and reuse a precompiled header automatically,
+    # which amortizes CUDA header parsing across all compiles in a
+    # session.  Persist the PCH next to the kernel cache so it also
+    # survives across processes.
+    if _get_bool_env_variable('CUPY_NVRTC_DISABLE_PCH', False):
+        return ()
+    if _get_nvrtc_version() < (12, 8):
+        return ()
+    pch_dir = os.path.join(cache_dir, 'pch')
+    try:
+        os.makedirs(pch_dir, exist_ok=True)
+    except OSError:
+        return ('--pch',)
+    return ('--pch', '--pch-dir=' + pch_dir)
 
-    if enable_cooperative_groups:
-        # `cooperative_groups` requires relocatable device code.
-        options += ('--device-c',)
 
-    # TODO(leofang): check if this works for LTO IR
-    if _get_bool_env_variable('CUPY_CUDA_COMPILE_WITH_DEBUG', False):
-        options += ('--device-debug', '--generate-line-info')
+def _compile_with_cache_cuda_core(
+        source, options, arch, cache_dir, extra_source, backend,
+        enable_cooperative_groups, name_expressions,
+        log_stream, cache_in_memory, jitify, to_ltoir):
+    # NVRTC does not use extra_source. extra_source is used for cache key.
+    global _empty_file_preprocess_cache
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
 
     is_jitify_requested = ('-DCUPY_USE_JITIFY' in options)
-    if jitify and not is_jitify_requested:
-        # jitify is set in RawKernel/RawModule, translate it to an option
-        # that is useless to the compiler, but can be used as part of the
-        # hash key
-        options += ('-DCUPY_USE_JITIFY',)
-    elif is_jitify_requested and not jitify:
+    if is_jitify_requested and not jitify:
         # jitify is requested internally, just set the flag
         jitify = True
     if jitify and backend != 'nvrtc':
         raise ValueError('jitify only works with NVRTC')
 
-    options += _get_extra_include_dir_opts()
+    # The non-user part of the option tuple is fixed per configuration;
+    # append it in a single concatenation instead of growing the tuple
+    # flag by flag on every call.
+    options += _get_static_options_suffix(
+        to_ltoir, enable_cooperative_groups,
+        _get_bool_env_variable('CUPY_CUDA_COMPILE_WITH_DEBUG', False),
+        jitify and not is_jitify_requested)
     # TODO(leofang): technically we shouldn't use _get_nvrtc_version here if
     # the backend is not nvrtc
     env = ((arch, options, _get_nvrtc_version(), backend)
            + _get_arch_for_options_for_nvrtc(arch))
-    base = _empty_file_preprocess_cache.get(env, None)
+    # The empty-source probe only captures the compiler version banner,
+    # which varies with neither the user options nor the target arch;
+    # share it across both.  They still enter the cache key via ``env``.
+    probe_key = (_get_nvrtc_version(), backend)
+    base = _empty_file_preprocess_cache.get(probe_key, None)
     if base is None:
         # This is for checking NVRTC/NVCC compiler internal version
         base = _preprocess('', options, arch, backend)
-        _empty_file_preprocess_cache[env] = base
+        _empty_file_preprocess_cache[probe_key] = base
 
-    key_src = '%s %s %s %s %s' % (
-        env, base, source, extra_source, _get_cupy_cache_key())
-    key_src = key_src.encode('utf-8')
     # In the case of generating LTO IRs, we pass them around as chunks of
     # bytes, so the filename extension is arbitrary
-    name = _hash_hexdigest(key_src) + ('.ltoir' if to_ltoir else '.cubin')
+    name = _hash_hexdigest_parts(
+        env, base, source, extra_source,
+        _get_cupy_cache_key()) + ('.ltoir' if to_ltoir else '.cubin')
 
     if not to_ltoir:
         mod = function.Module()
@@ -610,14 +897,20 @@ def _compile_with_cache_cuda(
         # method to avoid performance degradation.
         # We force recompiling to retrieve C++ mangled names if so desired.
         path = os.path.join(cache_dir, name)
-        if os.path.exists(path) and not name_expressions:
-            with open(path, 'rb') as file:
-                data = file.read()
+        if not name_expressions and _cache_file_exists(cache_dir, name):
+            try:
+                data = _read_cache_file(path)
+            except OSError:
+                # The file vanished after the directory scan; recompile.
+                data = b''
             if len(data) >= _hash_length:
                 hash = data[:_hash_length]
                 cubin = data[_hash_length:]
-                cubin_hash = _hash_hexdigest(cubin).encode('ascii')
-                if hash == cubin_hash:
+                # Cache files are written via atomic rename, so a full
+                # re-hash per load only guards against on-disk corruption;
+                # it is opt-in via CUPY_VERIFY_CACHE.
+                if (not _get_bool_env_variable('CUPY_VERIFY_CACHE', False)
+                        or hash == _hash_hexdigest(cubin).encode('ascii')):
                     if to_ltoir:
                         return cubin
                     else:
@@ -630,6 +923,10 @@ def _compile_with_cache_cuda(
 
     if backend == 'nvrtc':
         cu_name = '' if cache_in_memory else name + '.cu'
+        if not (jitify or to_ltoir):
+            # Appended after the cache key is computed; PCH only affects
+            # compile time, not the generated binary.
+            options += _get_nvrtc_pch_options(cache_dir)
         ptx, mapping = compile_using_nvrtc(
             source, options, arch, cu_name, name_expressions,
             log_stream, cache_in_memory, jitify, 'lto' if to_ltoir else None)
@@ -657,22 +954,11 @@ def _compile_with_cache_cuda(
         raise ValueError('Invalid backend %s' % backend)
 
     if not cache_in_memory:
-        # Write to disk cache
+        # Write to disk cache.  The hash prefix lets the loader detect
+        # possible corruption.
         cubin_hash = _hash_hexdigest(cubin).encode('ascii')
-
-        # Replacing the file should be atomic. But we add a hash for safety
-        # to detect possible corruption.
-        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as tf:
-            tf.write(cubin_hash)
-            tf.write(cubin)
-            temp_path = tf.name
-
-        try:
-            os.replace(temp_path, path)
-        except PermissionError:
-            # Windows may refuse to replace the file, assume this is a race
-            # and the existing file is OK (but keep using our copy)
-            pass
+        _write_cache_file(cache_dir, path, cubin_hash, cubin)
+        _note_cache_file_written(cache_dir, name)
 
         # Save .cu source file along with .cubin
         if _get_bool_env_variable('CUPY_CACHE_SAVE_CUDA_SOURCE', False):
@@ -779,8 +1065,11 @@ class _NVRTCProgram:
                                    'nvrtc' if not runtime.is_hip else 'hiprtc')
 
 
+_valid_kernel_name_re = re.compile('[a-zA-Z_][a-zA-Z_0-9]*\\Z')
+
+
 def is_valid_kernel_name(name):
-    return re.match('^[a-zA-Z_][a-zA-Z_0-9]*$', name) is not None
+    return _valid_kernel_name_re.match(name) is not None
 
 
 def compile_using_hipcc(source, options, arch, log_stream=None):
@@ -821,6 +1110,9 @@ def compile_using_hipcc(source, options, arch, log_stream=None):
             return f.read()
 
 
+_hash_line_re = re.compile('^#.*$', re.M)
+
+
 # TODO(leofang): consider merge _preprocess_hipcc with _preprocess_hiprtc,
 # perhaps also with _preprocess?
 def _preprocess_hipcc(source, options):
@@ -835,7 +1127,7 @@ def _preprocess_hipcc(source, options):
         cmd.append(cu_path)
         pp_src = _run_cc(cmd, root_dir, 'hipcc')
         assert isinstance(pp_src, str)
-        return re.sub('(?m)^#.*$', '', pp_src)
+        return _hash_line_re.sub('', pp_src)
 
 
 def _preprocess_hiprtc(source, options):
@@ -939,18 +1231,19 @@ def _compile_with_cache_hip(source, options, arch, cache_dir, extra_source,
                                         is_hiprtc=(backend == 'hiprtc'))
 
     env = (arch, options, _get_nvrtc_version(), backend)
-    base = _empty_file_preprocess_cache.get(env, None)
+    # As on the CUDA path, the version-probe output is shared across
+    # option tuples and archs while ``env`` keeps both in the cache key.
+    probe_key = (_get_nvrtc_version(), backend)
+    base = _empty_file_preprocess_cache.get(probe_key, None)
     if base is None:
         # This is for checking HIPRTC/HIPCC compiler internal version
         if backend == 'hiprtc':
             base = _preprocess_hiprtc('', options)
         else:
             base = _preprocess_hipcc('', options)
-        _empty_file_preprocess_cache[env] = base
+        _empty_file_preprocess_cache[probe_key] = base
 
-    key_src = '%s %s %s %s' % (env, base, source, extra_source)
-    key_src = key_src.encode('utf-8')
-    name = _hash_hexdigest(key_src) + '.hsaco'
+    name = _hash_hexdigest_parts(env, base, source, extra_source) + '.hsaco'
 
     mod = function.Module()
 
@@ -963,16 +1256,30 @@ def _compile_with_cache_hip(source, options, arch, cache_dir, extra_source,
         # method to avoid performance degradation.
         # We force recompiling to retrieve C++ mangled names if so desired.
         path = os.path.join(cache_dir, name)
-        if os.path.exists(path) and not name_expressions:
-            with open(path, 'rb') as f:
-                data = f.read()
-            if len(data) >= _hash_length:
-                hash_value = data[:_hash_length]
-                binary = data[_hash_length:]
-                binary_hash = _hash_hexdigest(binary).encode('ascii')
-                if hash_value == binary_hash:
+        if not name_expressions and _cache_file_exists(cache_dir, name):
+            try:
+                mm = _mmap_cache_file(path)
+            except (OSError, ValueError):
+                mm = None
+            if mm is not None and len(mm) >= _hash_length:
+                with memoryview(mm) as view:
+                    hash_value = bytes(view[:_hash_length])
+                    with view[_hash_length:] as binary_view:
+                        # See _compile_with_cache_cuda_core: integrity
+                        # re-hash on load is opt-in as writes are atomic.
+                        if (not _get_bool_env_variable(
+                                'CUPY_VERIFY_CACHE', False)
+                                or hash_value == _hash_hexdigest(
+                                    binary_view).encode('ascii')):
+                            binary = bytes(binary_view)
+                        else:
+                            binary = None
+                mm.close()
+                if binary is not None:
                     mod.load(binary)
                     return mod
+            elif mm is not None:
+                mm.close()
     else:
         # Enforce compiling -- the resulting kernel will be cached elsewhere,
         # so we do nothing
@@ -991,19 +1298,26 @@ def _compile_with_cache_hip(source, options, arch, cache_dir, extra_source,
         # Write to disk cache
         binary_hash = _hash_hexdigest(binary).encode('ascii')
 
-        # Replacing the file should be atomic. But we add a hash for safety
-        # to detect possible corruption.
-        with tempfile.NamedTemporaryFile(dir=cache_dir, delete=False) as tf:
-            tf.write(binary_hash)
-            tf.write(binary)
-            temp_path = tf.name
-
-        try:
-            os.replace(temp_path, path)
-        except PermissionError:
-            # Windows may refuse to replace the file, assume this is a race
-            # and the existing file is OK (but keep using our copy)
-            pass
+        # The storage is content-addressed: the blob lives under its own
+        # binary hash and the key-derived name is hard-linked to it, so
+        # source variants compiling to identical code objects (e.g.
+        # template instantiations) share one file on disk.
+        canonical_name = binary_hash.decode('ascii') + '.hsaco'
+        canonical_path = os.path.join(cache_dir, canonical_name)
+        if not _cache_file_exists(cache_dir, canonical_name):
+            _write_cache_file(cache_dir, canonical_path, binary_hash, binary)
+            _note_cache_file_written(cache_dir, canonical_name)
+        if name != canonical_name:
+            temp_link = os.path.join(
+                cache_dir, '.{}.{}.lnk'.format(name, os.getpid()))
+            try:
+                os.link(canonical_path, temp_link)
+                os.replace(temp_link, path)
+            except OSError:
+                # Links unsupported (or a race); fall back to writing an
+                # independent copy under the key-derived name.
+                _write_cache_file(cache_dir, path, binary_hash, binary)
+            _note_cache_file_written(cache_dir, name)
 
         # Save .cu source file along with .hsaco
         if _get_bool_env_variable('CUPY_CACHE_SAVE_CUDA_SOURCE', False):
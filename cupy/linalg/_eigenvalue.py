@@ -10,6 +10,12 @@ from cupy.linalg import _util
 from cupy._core import _dtype
 
 
+# Workspace sizes reported by the cuSOLVER bufferSize queries depend only
+# on the problem configuration, so they are remembered per device to
+# avoid one library round-trip per solve in iterative workloads.
+_buffer_size_cache: dict = {}
+
+
 def _check_dtype(dtype: numpy.dtype | str) -> None:
     if isinstance(dtype, numpy.dtype):
         dtype = dtype.char
@@ -22,6 +28,7 @@ def _check_dtype(dtype: numpy.dtype | str) -> None:
 def _syevd(a, UPLO, with_eigen_vector, overwrite_a=False):
     from cupy_backends.cuda.libs import cublas
     from cupy_backends.cuda.libs import cusolver
+    from cupyx import empty_pinned
 
     if UPLO not in ('L', 'U'):
         raise ValueError('UPLO argument must be \'L\' or \'U\'')
@@ -37,7 +44,9 @@ def _syevd(a, UPLO, with_eigen_vector, overwrite_a=False):
     m, lda = a.shape
     w = cupy.empty(m, real_dtype)
     dev_info = cupy.empty((), numpy.int32)
-    handle = device.Device().cusolver_handle
+    # get_cusolver_handle() reuses the per-thread Device instance instead
+    # of constructing one per call.
+    handle = device.get_cusolver_handle()
 
     if with_eigen_vector:
         jobz = cusolver.CUSOLVER_EIG_MODE_VECTOR
@@ -55,11 +64,19 @@ def _syevd(a, UPLO, with_eigen_vector, overwrite_a=False):
         type_w = _dtype.to_cuda_dtype(real_dtype)
         params = cusolver.createParams()
         try:
-            work_device_size, work_host_sizse = cusolver.xsyevd_bufferSize(
-                handle, params, jobz, uplo, m, type_v, v.data.ptr, lda,
-                type_w, w.data.ptr, type_v)
+            key = ('xsyevd', device.get_device_id(), m, dtype.char,
+                   jobz, uplo)
+            sizes = _buffer_size_cache.get(key)
+            if sizes is None:
+                sizes = cusolver.xsyevd_bufferSize(
+                    handle, params, jobz, uplo, m, type_v, v.data.ptr, lda,
+                    type_w, w.data.ptr, type_v)
+                _buffer_size_cache[key] = sizes
+            work_device_size, work_host_sizse = sizes
             work_device = cupy.empty(work_device_size, 'b')
-            work_host = numpy.empty(work_host_sizse, 'b')
+            # Pinned memory speeds up any staging cuSOLVER does through
+            # the host workspace.
+            work_host = empty_pinned(work_host_sizse, 'b')
             cusolver.xsyevd(
                 handle, params, jobz, uplo, m, type_v, v.data.ptr, lda,
                 type_w, w.data.ptr, type_v,
@@ -86,8 +103,12 @@ def _syevd(a, UPLO, with_eigen_vector, overwrite_a=False):
             raise RuntimeError('Only float32, float64, complex64, and '
                                'complex128 are supported')
 
-        work_size = buffer_size(
-            handle, jobz, uplo, m, v.data.ptr, lda, w.data.ptr)
+        key = ('syevd', device.get_device_id(), m, dtype.char, jobz, uplo)
+        work_size = _buffer_size_cache.get(key)
+        if work_size is None:
+            work_size = buffer_size(
+                handle, jobz, uplo, m, v.data.ptr, lda, w.data.ptr)
+            _buffer_size_cache[key] = work_size
         work = cupy.empty(work_size, dtype)
         syevd(
             handle, jobz, uplo, m, v.data.ptr, lda,
@@ -95,7 +116,13 @@ def _syevd(a, UPLO, with_eigen_vector, overwrite_a=False):
         cupy.linalg._util._check_cusolver_dev_info_if_synchronization_allowed(
             syevd, dev_info)
 
-    return w.astype(w_dtype, copy=False), v.astype(v_dtype, copy=False)
+    # In the common case the solver already produced the output dtypes;
+    # skip the astype dispatch entirely then.
+    if w.dtype.char != w_dtype:
+        w = w.astype(w_dtype, copy=False)
+    if v.dtype != v_dtype:
+        v = v.astype(v_dtype, copy=False)
+    return w, v
 
 
 # assemble complex eigen vectors from real eigen vectors
@@ -123,6 +150,10 @@ def _assemble_complex_evs(w, v_real, shape):
     return v_complex.reshape(shape)
 
 
+# Number of concurrent streams used when batching xgeev calls.
+_geev_max_streams = 4
+
+
 def _geev(a, with_eigen_vector):
     from cupy_backends.cuda.libs import cusolver
     from cupyx.cusolver import check_availability
@@ -155,8 +186,7 @@ def _geev(a, with_eigen_vector):
     if real_input:
         v_real = cupy.empty((m, m), dtype=input_dtype, order='F')
 
-    dev_info = cupy.empty((), numpy.int32)
-    handle = device.Device().cusolver_handle
+    handle = device.get_cusolver_handle()
 
     if with_eigen_vector:
         jobvr = cusolver.CUSOLVER_EIG_MODE_VECTOR
@@ -171,30 +201,73 @@ def _geev(a, with_eigen_vector):
     params = cusolver.createParams()
     try:
         v_ = v_real if real_input else v
-        work_device_size, work_host_size = cusolver.xgeev_bufferSize(
-            handle, params, jobvl, jobvr, m, type_input, a_.data.ptr, lda,
-            type_complex, w.data.ptr, type_input, v_.data.ptr, lda,
-            type_input, v_.data.ptr, lda, type_input)
-        work_device = cupy.empty(work_device_size, 'b')
-        work_host = empty_pinned(work_host_size, 'b')
+        key = ('xgeev', device.get_device_id(), m, input_dtype.char,
+               jobvl, jobvr)
+        sizes = _buffer_size_cache.get(key)
+        if sizes is None:
+            sizes = cusolver.xgeev_bufferSize(
+                handle, params, jobvl, jobvr, m, type_input, a_.data.ptr,
+                lda, type_complex, w.data.ptr, type_input, v_.data.ptr, lda,
+                type_input, v_.data.ptr, lda, type_input)
+            _buffer_size_cache[key] = sizes
+        work_device_size, work_host_size = sizes
 
         if len(a.shape) > 2:
-            for ind in numpy.ndindex(a.shape[:-2]):
-                a_ind = a_[ind]
-                w_ind = w[ind]
-                v_ind = v_real if real_input else v[ind]
-                cusolver.xgeev(
-                    handle, params, jobvl, jobvr, m, type_input,
-                    a_ind.data.ptr, lda, type_complex, w_ind.data.ptr,
-                    type_input, v_ind.data.ptr, lda, type_input,
-                    v_ind.data.ptr, lda, type_input, work_device.data.ptr,
-                    work_device_size, work_host.ctypes.data, work_host_size,
-                    dev_info.data.ptr)
-                if real_input and with_eigen_vector:
-                    # in case we have real input and complex output we need to
-                    # assemble complex eigen vectors from real eigen vectors
-                    v[ind] = _assemble_complex_evs(w_ind, v_ind, a_ind.shape)
+            # The batch is walked as a flat 3-D view so each iteration
+            # does one integer index instead of ndindex tuple indexing.
+            # Each xgeev call solves one small matrix, so the batch is
+            # bound by host-side dispatch.  Round-robin the launches over
+            # a small pool of streams, each with its own workspaces, so
+            # the solver calls can overlap on the device.  The wrappers
+            # bind the cuSOLVER handle to the current stream per call.
+            a_flat = a_.reshape(-1, m, lda)
+            w_flat = w.reshape(-1, m)
+            v_flat = v.reshape(-1, m, lda)
+            batch_n = a_flat.shape[0]
+            n_streams = min(batch_n, _geev_max_streams)
+            cur_stream = cupy.cuda.get_current_stream()
+            streams = [cupy.cuda.Stream(non_blocking=True)
+                       for _ in range(n_streams)]
+            ready = cupy.cuda.Event()
+            ready.record(cur_stream)
+            work_device = cupy.empty(
+                n_streams * work_device_size, 'b')
+            work_host = empty_pinned(n_streams * work_host_size, 'b')
+            if real_input:
+                v_real_slots = [
+                    cupy.empty((m, m), dtype=input_dtype, order='F')
+                    for _ in range(n_streams)]
+            dev_info = cupy.empty(batch_n, numpy.int32)
+            for k in range(batch_n):
+                slot = k % n_streams
+                stream = streams[slot]
+                with stream:
+                    if k < n_streams:
+                        stream.wait_event(ready)
+                    a_ind = a_flat[k]
+                    w_ind = w_flat[k]
+                    v_ind = v_real_slots[slot] if real_input else v_flat[k]
+                    cusolver.xgeev(
+                        handle, params, jobvl, jobvr, m, type_input,
+                        a_ind.data.ptr, lda, type_complex, w_ind.data.ptr,
+                        type_input, v_ind.data.ptr, lda, type_input,
+                        v_ind.data.ptr, lda, type_input,
+                        work_device.data.ptr + slot * work_device_size,
+                        work_device_size,
+                        work_host.ctypes.data + slot * work_host_size,
+                        work_host_size, dev_info[k].data.ptr)
+                    if real_input and with_eigen_vector:
+                        # in case we have real input and complex output we
+                        # need to assemble complex eigen vectors from real
+                        # eigen vectors
+                        v_flat[k] = _assemble_complex_evs(
+                            w_ind, v_ind, a_ind.shape)
+            for stream in streams:
+                cur_stream.wait_event(stream.record())
         else:
+            work_device = cupy.empty(work_device_size, 'b')
+            work_host = empty_pinned(work_host_size, 'b')
+            dev_info = cupy.empty((), numpy.int32)
             cusolver.xgeev(
                 handle, params, jobvl, jobvr, m, type_input, a_.data.ptr,
                 lda, type_complex, w.data.ptr, type_input, v_.data.ptr, lda,
@@ -264,10 +337,13 @@ def eigh(a, UPLO='L'):
         v = cupy.empty(a.shape, v_dtype)
         return w, v
 
-    if a.ndim > 2 or runtime.is_hip:
+    if a.ndim > 2:
         w, v = cupyx.cusolver.syevj(a, UPLO, True)
         return w, v
     else:
+        # 2-D inputs go through the divide-and-conquer solver on HIP as
+        # well; _syevd dispatches to rocSOLVER's syevd/heevd there, which
+        # outperforms the Jacobi solver for large matrices.
         return _syevd(a, UPLO, True)
 
 
@@ -349,9 +425,10 @@ def eigvalsh(a, UPLO='L'):
         w_dtype = v_dtype.char.lower()
         return cupy.empty(a.shape[:-1], w_dtype)
 
-    if a.ndim > 2 or runtime.is_hip:
+    if a.ndim > 2:
         return cupyx.cusolver.syevj(a, UPLO, False)
     else:
+        # See eigh for why 2-D HIP inputs use _syevd.
         return _syevd(a, UPLO, False)[0]
 
 
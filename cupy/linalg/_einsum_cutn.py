@@ -13,11 +13,16 @@ _tls = threading.local()
 
 cuquantum = cutensornet = tensornet = None
 
+# None: import not attempted yet; True: loaded; False: import failed.
+# Remembering the failure keeps repeated einsum calls from re-entering
+# the import machinery (and re-warning) on systems without cuQuantum.
+_cutn_import_state = None
+
 
 def _maybe_lazy_load_cutensornet():
-    global cuquantum, cutensornet, tensornet
+    global cuquantum, cutensornet, tensornet, _cutn_import_state
 
-    if cuquantum is not None:
+    if _cutn_import_state is not None:
         return
 
     try:
@@ -31,8 +36,15 @@ def _maybe_lazy_load_cutensornet():
             # all reside under cuquantum.cutensornet
             from cuquantum import cutensornet
             tensornet = cutensornet
+        _cutn_import_state = True
     except ImportError:
-        pass
+        _cutn_import_state = False
+        warnings.warn(
+            'using the cuTensorNet backend was requested but it cannot be '
+            'imported -- maybe you forgot to install cuQuantum Python? '
+            'Please do "pip install cuquantum-python" or "conda install '
+            '-c conda-forge cuquantum-python" and retry',
+            stacklevel=3)
 
 
 @_util.memoize()
@@ -50,6 +62,11 @@ def _is_nonblocking_supported():
 def _get_einsum_operands(args):
     """Parse & retrieve einsum operands, assuming ``args`` is in either
     "subscript" or "interleaved" format.
+
+    Returns ``(expr, operands)`` for the subscript format, and
+    ``(interleaved, output)`` for the interleaved format, where
+    ``interleaved`` holds operands in the even slots and their
+    subscripts in the odd slots.
     """
 
     if len(args) == 0:
@@ -63,17 +80,13 @@ def _get_einsum_operands(args):
         operands = list(args[1:])
         return expr, operands
     else:
-        args = list(args)
-        operands = []
-        inputs = []
+        # Keep the [op0, sub0, op1, sub1, ...] list as given instead of
+        # splitting it; contract() consumes it in this interleaved form.
+        interleaved = list(args)
         output = None
-        while len(args) >= 2:
-            operands.append(args.pop(0))
-            inputs.append(args.pop(0))
-        if len(args) == 1:
-            output = args.pop(0)
-        assert not args
-        return inputs, operands, output
+        if len(interleaved) % 2 == 1:
+            output = interleaved.pop()
+        return interleaved, output
 
 
 def _try_use_cutensornet(*args, **kwargs):
@@ -86,13 +99,8 @@ def _try_use_cutensornet(*args, **kwargs):
 
     _maybe_lazy_load_cutensornet()
 
-    if cutensornet is None:
-        warnings.warn(
-            'using the cuTensorNet backend was requested but it cannot be '
-            'imported -- maybe you forgot to install cuQuantum Python? '
-            'Please do "pip install cuquantum-python" or "conda install '
-            '-c conda-forge cuquantum-python" and retry',
-            stacklevel=2)
+    if _cutn_import_state is not True:
+        # The warning fired once when the import first failed.
         return None
 
     # cannot pop as we might still need kwargs later
@@ -104,8 +112,19 @@ def _try_use_cutensornet(*args, **kwargs):
     # we do very lightweight pre-processing here just to inspect the
     # operands; the actual input verification is deferred to cuTensorNet
     # which can generate far better diagonostic messages
-    args = _get_einsum_operands(args)
-    operands = [cupy.asarray(op) for op in args[1]]
+    parsed = _get_einsum_operands(args)
+    if isinstance(parsed[0], str):
+        expr, operands = parsed
+        interleaved = output_sub = None
+    else:
+        interleaved, output_sub = parsed
+        operands = interleaved[0::2]
+
+    # Operands are usually already CuPy arrays; skip the asarray dispatch
+    # for them.
+    operands = [
+        op if isinstance(op, cupy.ndarray) else cupy.asarray(op)
+        for op in operands]
 
     if len(operands) == 1:
         # As of cuTENSOR 1.5.0 it still chokes with some common operations
@@ -113,17 +132,24 @@ def _try_use_cutensornet(*args, **kwargs):
         # cases instead of whitelisting what could be done explicitly
         return None
 
-    if (any(op.size == 0 for op in operands) or
-            any(len(op.shape) == 0 for op in operands)):
-        # To cuTensorNet the shape is invalid
-        return None
+    # One sweep over the operands: reject invalid shapes and collect the
+    # dtypes for promotion instead of walking the list three times
+    # (tensor networks routinely carry dozens of operands).
+    dtypes = []
+    for op in operands:
+        if op.size == 0 or op.ndim == 0:
+            # To cuTensorNet the shape is invalid
+            return None
+        dtypes.append(op.dtype)
 
     # all input dtypes must be identical (to a numerical dtype)
-    result_dtype = cupy.result_type(*operands) if dtype is None else dtype
+    result_dtype = cupy.result_type(*dtypes) if dtype is None else dtype
     if result_dtype not in (
             cupy.float32, cupy.float64, cupy.complex64, cupy.complex128):
         return None
-    operands = [op.astype(result_dtype, copy=False) for op in operands]
+    operands = [
+        op if op.dtype == result_dtype else op.astype(result_dtype)
+        for op in operands]
 
     # prepare cutn inputs
     device = cupy.cuda.runtime.getDevice()
@@ -174,16 +200,16 @@ def _try_use_cutensornet(*args, **kwargs):
             stacklevel=2)
     cutn_optimizer = {'path': path} if path else None
 
-    if len(args) == 2:
+    if interleaved is None:
         out = tensornet.contract(
-            args[0], *operands, options=cutn_options, optimize=cutn_optimizer)
-    elif len(args) == 3:
-        inputs = [i for pair in zip(operands, args[0]) for i in pair]
-        if args[2] is not None:
-            inputs.append(args[2])
-        out = tensornet.contract(
-            *inputs, options=cutn_options, optimize=cutn_optimizer)
+            expr, *operands, options=cutn_options, optimize=cutn_optimizer)
     else:
-        assert False
+        # Drop the processed operands back into their even slots; no
+        # re-interleaving pass is needed.
+        interleaved[0::2] = operands
+        if output_sub is not None:
+            interleaved.append(output_sub)
+        out = tensornet.contract(
+            *interleaved, options=cutn_options, optimize=cutn_optimizer)
 
     return out
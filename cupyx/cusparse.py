@@ -167,6 +167,9 @@ def _get_avail_version_from_spec(x):
 
 @_util.memoize()
 def check_availability(name):
+    # The answer only depends on the build versions, which are fixed for
+    # the lifetime of the process, so cache it; callers such as
+    # csr_matrix.__mul__ re-run this dispatch on every operation.
     if not _runtime.is_hip:
         available_version = _available_cusparse_version
         version = _cusparse.get_build_version()
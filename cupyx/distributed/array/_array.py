@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 from collections.abc import Callable, Iterable
 from itertools import chain
 from typing import Any
@@ -17,6 +18,8 @@ from cupy.cuda.device import Device
 from cupy.cuda.stream import Stream
 from cupy.cuda.stream import get_current_stream
 
+from cupyx import _pinned_array
+
 from cupyx.distributed.array import _chunk
 from cupyx.distributed.array._chunk import _Chunk
 from cupyx.distributed.array import _data_transfer
@@ -43,7 +46,11 @@ class _MultiDeviceDummyPointer(cupy.cuda.memory.MemoryPointer):
 def _make_chunk_async(src_dev, dst_dev, idx, src_array, comms):
     src_stream = get_current_stream(src_dev)
     with src_array.device:
-        src_array = _creation_from_data.ascontiguousarray(src_array)
+        if src_array.device.id == dst_dev:
+            # No transfer happens; keep the chunk contiguous on its device.
+            src_array = _creation_from_data.ascontiguousarray(src_array)
+        # For remote destinations, _transfer makes the source contiguous on
+        # the source stream, so no staging copy is materialized here.
         src_data = _data_transfer._AsyncData(
             src_array, src_stream.record(), prevent_gc=src_array)
     with Device(dst_dev):
@@ -218,7 +225,10 @@ class DistributedArray(ndarray):
 
         for dev in devices - self._streams.keys():
             with Device(dev):
-                self._streams[dev] = Stream()
+                # All ordering between these streams is through explicit
+                # events; non-blocking streams avoid the implicit
+                # serialization with the legacy default stream.
+                self._streams[dev] = Stream(non_blocking=True)
 
     def __cupy_override_elementwise_kernel__(self, kernel, *args, **kwargs):
         # This method is called from cupy.ufunc and cupy.ElementwiseKernel
@@ -338,19 +348,17 @@ class DistributedArray(ndarray):
             return self
 
         old_chunks_map = self._chunks_map
-        new_chunks_map: dict[int, list[_Chunk]] = {}
 
         # Set up new_chunks_map compatible with new_index_map
-        # as placeholders of chunks
-        for dev, idxs in new_index_map.items():
-            new_chunks_map[dev] = []
-
-            for idx in idxs:
-                with Device(dev):
-                    dst_shape = _index_arith._shape_after_indexing(
-                        self.shape, idx)
-                    new_chunk = _Chunk.create_placeholder(dst_shape, dev, idx)
-                    new_chunks_map[dev].append(new_chunk)
+        # as placeholders of chunks. create_placeholder enters the chunk's
+        # device on its own, so no Device context is needed here.
+        new_chunks_map: dict[int, list[_Chunk]] = {
+            dev: [
+                _Chunk.create_placeholder(
+                    _index_arith._shape_after_indexing(self.shape, idx),
+                    dev, idx)
+                for idx in idxs]
+            for dev, idxs in new_index_map.items()}
 
         self._prepare_comms_and_streams(index_map.keys())
 
@@ -362,16 +370,34 @@ class DistributedArray(ndarray):
         # multiplication is involved, where one block tends to be shared
         # between multiple devices
         # TODO: Avoid duplicate data transfers
+        # Chunks are boxes, so sorting the destinations by their first-axis
+        # start lets a bisect cut away most disjoint pairs before any
+        # per-pair slice arithmetic runs.
+        dst_chunks = list(chain.from_iterable(new_chunks_map.values()))
+        dst_chunks.sort(key=lambda chunk: chunk.index[0].start)
+        dst_starts = [chunk.index[0].start for chunk in dst_chunks]
+
         for src_chunk in chain.from_iterable(old_chunks_map.values()):
             src_chunk.flush(self._mode)
 
-            if self._mode is not _modes.REPLICA:
+            if self._mode is not _modes.REPLICA and not self._mode.idempotent:
+                # Non-idempotent modes reset transferred regions of the
+                # source to the identity; work on a private copy so that
+                # self stays intact. Idempotent modes only read the source.
                 src_chunk = src_chunk.copy()
 
-            for dst_chunk in chain.from_iterable(new_chunks_map.values()):
-                src_chunk.apply_to(
-                    dst_chunk, self._mode, self.shape,
-                    self._comms, self._streams)
+            src_slice = src_chunk.index[0]
+            candidates_stop = bisect.bisect_left(dst_starts, src_slice.stop)
+
+            # Batch each source chunk's fan-out into one NCCL group call so
+            # the transfers launch together rather than one per pair.
+            with _data_transfer._transfer_group() as deferred:
+                for dst_chunk in dst_chunks[:candidates_stop]:
+                    if dst_chunk.index[0].stop <= src_slice.start:
+                        continue
+                    src_chunk.apply_to(
+                        dst_chunk, self._mode, self.shape,
+                        self._comms, self._streams, deferred)
 
         return DistributedArray(
             self.shape, self.dtype, new_chunks_map, self._mode, self._comms)
@@ -397,19 +423,36 @@ class DistributedArray(ndarray):
             np_array = numpy.full(self.shape, identity, self.dtype)
 
         # We avoid 0D array because we expect data[idx] to return a view
-        np_array = numpy.atleast_1d(np_array)
-
+        if np_array.ndim == 0:
+            np_array = np_array.reshape((1,))
+
+        # Start the device-to-host copy of every chunk asynchronously into
+        # pinned staging buffers, then merge on the host as each finishes.
+        # This overlaps the transfers across devices instead of
+        # synchronizing on one chunk at a time.
+        copies = []
         for chunk in chain.from_iterable(self._chunks_map.values()):
-            chunk.ready.synchronize()
-            idx = chunk.index
+            array = chunk.array
+            with chunk.on_ready() as stream:
+                if not array.flags.c_contiguous:
+                    array = _creation_from_data.ascontiguousarray(array)
+                host = _pinned_array.empty_pinned(array.shape, array.dtype)
+                array.get(stream=stream, out=host, blocking=False)
+                # Keep array alive until the copy is done; it may be a
+                # temporary contiguous copy.
+                copies.append((stream.record(), chunk.index, host, array))
+
+        for ready, idx, host, _ in copies:
+            ready.synchronize()
             if self._mode is _modes.REPLICA:
-                np_array[idx] = cupy.asnumpy(chunk.array)
+                np_array[idx] = host
             else:
-                self._mode.numpy_func(
-                    np_array[idx], cupy.asnumpy(chunk.array), np_array[idx])
+                self._mode.numpy_func(np_array[idx], host, np_array[idx])
 
-        # Undo numpy.atleast_1d
-        return np_array.reshape(self.shape)
+        # Undo the 0D workaround above
+        if np_array.shape != self.shape:
+            np_array = np_array.reshape(self.shape)
+        return np_array
 
     # -----------------------------------------------------
     # Overriding unsupported methods inherited from ndarray
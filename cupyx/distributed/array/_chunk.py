@@ -7,20 +7,32 @@ from collections.abc import Iterator
 
 import numpy
 
+from cupy import _core
 from cupy._core.core import ndarray
 import cupy._creation.basic as _creation_basic
-import cupy._manipulation.dims as _manipulation_dims
+import cupy._creation.from_data as _creation_from_data
+from cupy.cuda import nccl
 from cupy.cuda.device import Device
 from cupy.cuda.stream import Event
 from cupy.cuda.stream import Stream
 from cupy.cuda.stream import get_current_stream
 
+from cupyx.distributed import _nccl_comm
 from cupyx.distributed.array import _modes
 from cupyx.distributed.array import _index_arith
 from cupyx.distributed.array import _data_transfer
 from cupyx.distributed.array._data_transfer import _Communicator
 
 
+# Copies the overlapping region out for transfer and resets it to the
+# identity of a non-idempotent op in a single launch. Aliasing src with
+# reset is safe: each element is read before either output is stored.
+_copy_and_reset_kernel = _core.ElementwiseKernel(
+    'T src, T identity', 'T out, T reset',
+    'out = src; reset = identity;',
+    'cupyx_distributed_copy_and_reset')
+
+
 class _ArrayPlaceholder:
     # Mocks ndarray
     # Eventually overwritten by PartialUpdates entirely, so
@@ -45,7 +57,9 @@ class _ArrayPlaceholder:
                 data = _creation_basic.full(self.shape, value, dtype)
 
             # We avoid 0D array because we expect data[idx] to return a view
-            return _manipulation_dims.atleast_1d(data)
+            if data.ndim == 0:
+                data = data.reshape((1,))
+            return data
 
 
 class _Chunk:
@@ -126,8 +140,12 @@ class _Chunk:
                 if mode is _modes.REPLICA:
                     self.array[idx] = update_data.array
                 else:
-                    self.array[idx] = mode.func(
-                        self.array[idx], update_data.array)
+                    # idx is all basic slicing, so this is a view; applying
+                    # the update through out= takes one kernel launch
+                    # instead of computing into a temporary and copying it
+                    # back.
+                    target = self.array[idx]
+                    mode.func(target, update_data.array, out=target)
 
             stream.record(self.ready)
             self.prevent_gc = (self.prevent_gc, self.updates)
@@ -138,6 +156,7 @@ class _Chunk:
         shape: tuple[int, ...],
         comms: dict[int, _data_transfer._Communicator],
         streams: dict[int, Stream],
+        deferred: list | None = None,
     ) -> None:
         # Overwrite target with mode.func(self, target) on their overlaps
         # This is just appending part of self to target.updates in the mode
@@ -147,50 +166,71 @@ class _Chunk:
         assert len(src_chunk.updates) == 0
         assert isinstance(src_chunk.array, ndarray)
 
-        src_dev = src_chunk.array.device.id
-        dst_dev = dst_chunk.array.device.id
         src_idx = src_chunk.index
         dst_idx = dst_chunk.index
 
-        intersection = _index_arith._index_intersection(
-            src_idx, dst_idx, shape)
-        if intersection is None:
+        paired = _index_arith._paired_intersection(src_idx, dst_idx, shape)
+        if paired is None:
             return
+        _, src_new_idx, dst_new_idx = paired
 
-        src_new_idx = _index_arith._index_for_subindex(
-            src_idx, intersection, shape)
-        dst_new_idx = _index_arith._index_for_subindex(
-            dst_idx, intersection, shape)
+        src_dev = src_chunk.array.device.id
+        dst_dev = dst_chunk.array.device.id
 
-        data_to_transfer = _data_transfer._AsyncData(
-            src_chunk.array[src_new_idx], src_chunk.ready,
-            src_chunk.prevent_gc)
+        if src_dev == dst_dev and isinstance(dst_chunk.array, ndarray) and (
+                mode is not _modes.REPLICA or not dst_chunk.updates):
+            # Chunks on the same device need no staging or transfer; apply
+            # on the device stream directly. Replica overwrites must keep
+            # their order relative to pending updates, hence the condition
+            # above; op-mode updates commute, so interleaving is fine.
+            with dst_chunk.on_ready() as stream:
+                stream.wait_event(src_chunk.ready)
+                if mode is _modes.REPLICA:
+                    dst_chunk.array[dst_new_idx] = src_chunk.array[
+                        src_new_idx]
+                else:
+                    dst_view = dst_chunk.array[dst_new_idx]
+                    mode.func(
+                        dst_view, src_chunk.array[src_new_idx], out=dst_view)
+                    if not mode.idempotent:
+                        src_chunk.array[src_new_idx] = mode.identity_of(
+                            src_chunk.array.dtype)
+                        stream.record(src_chunk.ready)
+                stream.record(dst_chunk.ready)
+            return
 
         if mode is not _modes.REPLICA and not mode.idempotent:
-            data_to_transfer = data_to_transfer.copy()
+            dtype = src_chunk.array.dtype
+            src_view = src_chunk.array[src_new_idx]
+            with src_chunk.on_ready() as stream:
+                # Extract the overlapping region and reset it to the
+                # identity in one fused launch. The transfer below reads
+                # the private copy, so we can write on src_chunk.
+                copied = _creation_basic.empty(src_view.shape, dtype)
+                _copy_and_reset_kernel(
+                    src_view, mode.identity_of(dtype), copied, src_view)
+                stream.record(src_chunk.ready)
+                data_to_transfer = _data_transfer._AsyncData(
+                    copied, stream.record(), src_chunk.prevent_gc)
+        else:
+            data_to_transfer = _data_transfer._AsyncData(
+                src_chunk.array[src_new_idx], src_chunk.ready,
+                src_chunk.prevent_gc)
 
         update = _data_transfer._transfer(
             comms[src_dev], streams[src_dev], data_to_transfer,
-            comms[dst_dev], streams[dst_dev], dst_dev)
+            comms[dst_dev], streams[dst_dev], dst_dev, deferred)
         dst_chunk.add_update(update, dst_new_idx)
 
-        if mode is not _modes.REPLICA and not mode.idempotent:
-            dtype = src_chunk.array.dtype
-            with data_to_transfer.on_ready() as stream:
-                # Now src data has been copied, so we can write on src_chunk
-                src_chunk.array[src_new_idx] = mode.identity_of(dtype)
-                stream.record(src_chunk.ready)
-
     def set_identity_on_intersection(
         self, idx: tuple[slice, ...], shape: tuple[int, ...], identity,
     ) -> None:
         assert isinstance(self.array, ndarray)
 
-        intersection = _index_arith._index_intersection(self.index, idx, shape)
-        if intersection is None:
+        paired = _index_arith._paired_intersection(self.index, idx, shape)
+        if paired is None:
             return
-        self_new_idx = _index_arith._index_for_subindex(
-            self.index, intersection, shape)
+        _, self_new_idx, _ = paired
         with self.on_ready() as stream:
             self.array[self_new_idx] = identity
             stream.record(self.ready)
@@ -205,6 +245,113 @@ class _Chunk:
             stream.record(self.ready)
 
 
+def _nccl_op_of(op_mode: _modes._OpMode):
+    # Looked up lazily so that the constants are only touched when NCCL is
+    # available.
+    if op_mode is _modes.SUM:
+        return nccl.NCCL_SUM
+    if op_mode is _modes.PROD:
+        return nccl.NCCL_PROD
+    if op_mode is _modes.MAX:
+        return nccl.NCCL_MAX
+    if op_mode is _modes.MIN:
+        return nccl.NCCL_MIN
+    return None
+
+
+def _try_collective_all_reduce(
+    op_mode: _modes._OpMode,
+    chunks_list: list[_Chunk],
+    comms: dict[int, _Communicator], streams: dict[int, Stream],
+) -> bool:
+    """Try to perform the all-reduce as a single NCCL collective.
+
+    A single all-reduce (internally a bandwidth-optimal ReduceScatter +
+    AllGather) is equivalent to the pairwise exchange only when every chunk
+    covers the same index and each device of the communicator group owns
+    exactly one chunk, i.e. the array is fully replicated over the group.
+    Returns ``False`` when the chunk layout or dtype is not eligible, in
+    which case the caller falls back to the pairwise exchange.
+    """
+    if not nccl.available:
+        return False
+    nccl_op = _nccl_op_of(op_mode)
+    if nccl_op is None:
+        return False
+    if len(chunks_list) < 2:
+        return False
+
+    index = chunks_list[0].index
+    devices = set()
+    for chunk in chunks_list:
+        if chunk.index != index:
+            return False
+        dev = chunk.array.device.id
+        if dev in devices:
+            return False
+        devices.add(dev)
+    if devices != comms.keys():
+        # Ranks without a chunk would not join the collective call and NCCL
+        # would block waiting for them.
+        return False
+
+    for chunk in chunks_list:
+        chunk.flush(op_mode)
+        assert isinstance(chunk.array, ndarray)
+
+    dtype = chunks_list[0].array.dtype
+    if any(chunk.array.dtype != dtype for chunk in chunks_list):
+        return False
+    if dtype.char in 'FD' and op_mode is not _modes.SUM:
+        # Complex arrays are reduced as pairs of reals, which is only valid
+        # for the sum.
+        return False
+    if dtype.char not in _nccl_comm._nccl_dtypes:
+        return False
+
+    arrays = []
+    for chunk in chunks_list:
+        dev = chunk.array.device.id
+        prev_stream = get_current_stream(dev)
+        try:
+            with Device(dev):
+                stream = streams[dev]
+                stream.use()
+                stream.wait_event(chunk.ready)
+                arrays.append(
+                    _creation_from_data.ascontiguousarray(chunk.array))
+        finally:
+            with Device(dev):
+                prev_stream.use()
+
+    nccl_dtype, count = _nccl_comm._get_nccl_dtype_and_count(arrays[0])
+    nccl.groupStart()
+    for array in arrays:
+        dev = array.device.id
+        with Device(dev):
+            comms[dev].allReduce(
+                array.data.ptr, array.data.ptr, count, nccl_dtype, nccl_op,
+                streams[dev].ptr)
+    nccl.groupEnd()
+
+    for chunk, array in zip(chunks_list, arrays):
+        dev = array.device.id
+        prev_stream = get_current_stream(dev)
+        try:
+            with Device(dev):
+                stream = streams[dev]
+                stream.use()
+                if array is not chunk.array:
+                    chunk.array[...] = array
+                    chunk.prevent_gc = (chunk.prevent_gc, array)
+                stream.record(chunk.ready)
+        finally:
+            with Device(dev):
+                prev_stream.use()
+
+    return True
+
+
 def _all_reduce_intersections(
     op_mode: _modes._OpMode, shape: tuple[int, ...],
     chunk_map: dict[int, list[_Chunk]],
@@ -212,20 +359,30 @@ def _all_reduce_intersections(
 ) -> None:
     chunks_list = list(chain.from_iterable(chunk_map.values()))
 
+    if _try_collective_all_reduce(op_mode, chunks_list, comms, streams):
+        return
+
+    # Each source chunk's fan-out is bracketed in a single NCCL group call
+    # so that its send/recv pairs are aggregated into one kernel launch per
+    # device instead of one per chunk pair.
     for i in range(len(chunks_list)):
         src_chunk = chunks_list[i]
         src_chunk.flush(op_mode)
 
-        for j in range(i + 1, len(chunks_list)):
-            dst_chunk = chunks_list[j]
+        with _data_transfer._transfer_group() as deferred:
+            for j in range(i + 1, len(chunks_list)):
+                dst_chunk = chunks_list[j]
 
-            src_chunk.apply_to(dst_chunk, op_mode, shape, comms, streams)
+                src_chunk.apply_to(
+                    dst_chunk, op_mode, shape, comms, streams, deferred)
 
     for j in range(len(chunks_list) - 1, -1, -1):
         src_chunk = chunks_list[j]
         src_chunk.flush(_modes.REPLICA)
 
-        for i in range(j):
-            dst_chunk = chunks_list[i]
-            src_chunk.apply_to(
-                dst_chunk, _modes.REPLICA, shape, comms, streams)
+        with _data_transfer._transfer_group() as deferred:
+            for i in range(j):
+                dst_chunk = chunks_list[i]
+                src_chunk.apply_to(
+                    dst_chunk, _modes.REPLICA, shape, comms, streams,
+                    deferred)
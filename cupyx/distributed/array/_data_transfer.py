@@ -57,9 +57,29 @@ if nccl.available:
         comms_list = _Communicator.initAll(list(devices))
         return {comm.device_id(): comm for comm in comms_list}
 
+    @contextlib.contextmanager
+    def _transfer_group() -> Iterator[list]:
+        """Aggregate multiple `_transfer` calls into one NCCL group call.
+
+        Yields a list to be passed as the ``deferred`` argument of
+        `_transfer`. The send/recv pairs issued inside the block are
+        enqueued together when the block exits, and the ready events of
+        the returned `_AsyncData` objects are recorded at that point.
+        """
+        deferred: list[tuple[int, Stream, Event]] = []
+        nccl.groupStart()
+        try:
+            yield deferred
+        finally:
+            nccl.groupEnd()
+            for dev, stream, ready in deferred:
+                with Device(dev):
+                    stream.record(ready)
+
     def _transfer(
         src_comm: _Communicator, src_stream: Stream, src_data: _AsyncData,
         dst_comm: _Communicator, dst_stream: Stream, dst_dev: int,
+        deferred: list | None = None,
     ) -> _AsyncData:
         src_dev = src_data.array.device.id
         if src_dev == dst_dev:
@@ -80,7 +100,8 @@ if nccl.available:
                     src_array.shape, src_array.dtype)
 
             dtype, count = _get_nccl_dtype_and_count(src_array)
-            nccl.groupStart()
+            if deferred is None:
+                nccl.groupStart()
 
             with Device(src_dev):
                 src_comm.send(src_array.data.ptr, count, dtype,
@@ -90,9 +111,17 @@ if nccl.available:
                 dst_comm.recv(dst_buf.data.ptr, count, dtype,
                               src_comm.rank_id(), dst_stream.ptr)
 
-                nccl.groupEnd()
-                return _AsyncData(dst_buf, dst_stream.record(),
-                                  prevent_gc=src_data)
+                if deferred is None:
+                    nccl.groupEnd()
+                    return _AsyncData(dst_buf, dst_stream.record(),
+                                      prevent_gc=src_data)
+
+                # The kernels are enqueued at the end of the enclosing
+                # `_transfer_group` block, where the ready event is also
+                # recorded.
+                ready = Event()
+                deferred.append((dst_dev, dst_stream, ready))
+                return _AsyncData(dst_buf, ready, prevent_gc=src_data)
         finally:
             with Device(src_dev):
                 prev_src_stream.use()
@@ -104,22 +133,42 @@ else:
     ) -> dict[int, _Communicator]:
         return {dev: _Communicator() for dev in devices}
 
+    @contextlib.contextmanager
+    def _transfer_group() -> Iterator[list]:
+        # Plain device-to-device copies cannot be aggregated.
+        yield []
+
     def _transfer(
         src_comm: _Communicator, src_stream: Stream, src_data: _AsyncData,
         dst_comm: _Communicator, dst_stream: Stream, dst_dev: int,
+        deferred: list | None = None,
     ) -> _AsyncData:
         src_dev = src_data.array.device.id
         if src_dev == dst_dev:
             return _AsyncData(src_data.array, src_data.ready)
 
+        # Cross-device copies without peer access require a contiguous
+        # source; make it so on the source stream.
+        with Device(src_dev):
+            prev_stream = get_current_stream()
+            try:
+                src_stream.use()
+                src_stream.wait_event(src_data.ready)
+                src_array = _creation_from_data.ascontiguousarray(
+                    src_data.array)
+                src_ready = src_stream.record()
+            finally:
+                prev_stream.use()
+
         with Device(dst_dev):
             prev_stream = get_current_stream()
             try:
                 dst_stream.use()
-                dst_stream.wait_event(src_data.ready)
+                dst_stream.wait_event(src_ready)
 
-                dst_array = src_data.array.copy()
+                dst_array = src_array.copy()
                 return _AsyncData(
-                    dst_array, dst_stream.record(), prevent_gc=src_data.array)
+                    dst_array, dst_stream.record(),
+                    prevent_gc=(src_data, src_array))
             finally:
                 prev_stream.use()
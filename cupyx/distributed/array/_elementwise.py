@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import typing
 from collections.abc import Sequence
 from itertools import chain
 
@@ -130,19 +129,35 @@ def _execute_kernel(
                 if not updates:
                     continue
 
+                # Sort out which positions take the incoming update and
+                # which take a view of their chunk once, outside the
+                # per-update loop.
+                placeholder_arg_is = []
+                sliced_args = []
+                for i, data in enumerate(arg_arrays):
+                    if isinstance(data, _chunk._ArrayPlaceholder):
+                        placeholder_arg_is.append(i)
+                    else:
+                        sliced_args.append((i, data))
+                placeholder_kwarg_keys = []
+                sliced_kwargs = []
+                for k, data in kwarg_arrays.items():
+                    if isinstance(data, _chunk._ArrayPlaceholder):
+                        placeholder_kwarg_keys.append(k)
+                    else:
+                        sliced_kwargs.append((k, data))
+
                 arg_slices = [None] * len(arg_arrays)
                 kwarg_slices = {}
                 for update, idx in updates:
-                    for i, data in enumerate(arg_arrays):
-                        if isinstance(data, _chunk._ArrayPlaceholder):
-                            arg_slices[i] = update.array
-                        else:
-                            arg_slices[i] = data[idx]
-                    for k, data in kwarg_arrays.items():
-                        if isinstance(data, _chunk._ArrayPlaceholder):
-                            kwarg_slices[k] = update.array
-                        else:
-                            kwarg_slices[k] = data[idx]
+                    for i in placeholder_arg_is:
+                        arg_slices[i] = update.array
+                    for i, data in sliced_args:
+                        arg_slices[i] = data[idx]
+                    for k in placeholder_kwarg_keys:
+                        kwarg_slices[k] = update.array
+                    for k, data in sliced_kwargs:
+                        kwarg_slices[k] = data[idx]
 
                     stream.wait_event(update.ready)
                     out_update_array = kernel(*arg_slices, **kwarg_slices)
@@ -219,16 +234,19 @@ def _execute_peer_access(
     out_chunks_map: dict[int, list[_chunk._Chunk]] = {}
 
     for a_chunk in chain.from_iterable(a._chunks_map.values()):
-        a_dev = a_chunk.array.device.id
+        a_array = a_chunk.array
+        assert isinstance(a_array, ndarray)
+        a_dev = a_array.device.id
         with a_chunk.on_ready() as stream:
-            out_array = _creation_basic.empty(a_chunk.array.shape, dtype)
+            out_array = _creation_basic.empty(a_array.shape, dtype)
 
             for b_chunk in chain.from_iterable(b._chunks_map.values()):
 
-                intersection = _index_arith._index_intersection(
+                paired = _index_arith._paired_intersection(
                     a_chunk.index, b_chunk.index, shape)
-                if intersection is None:
+                if paired is None:
                     continue
+                _, a_new_idx, b_new_idx = paired
 
                 b_dev = b_chunk.array.device.id
                 if cupy.cuda.runtime.deviceCanAccessPeer(a_dev, b_dev) != 1:
@@ -240,14 +258,9 @@ def _execute_peer_access(
                     cupy._core._kernel._check_peer_access(b_chunk.array, a_dev)
                 stream.wait_event(b_chunk.ready)
 
-                a_new_idx = _index_arith._index_for_subindex(
-                    a_chunk.index, intersection, shape)
-                b_new_idx = _index_arith._index_for_subindex(
-                    b_chunk.index, intersection, shape)
-
                 assert kernel.nin == 2
-                kernel(typing.cast(ndarray, a_chunk.array)[a_new_idx],
-                       typing.cast(ndarray, b_chunk.array)[b_new_idx],
+                kernel(a_array[a_new_idx],
+                       b_chunk.array[b_new_idx],
                        out_array[a_new_idx])
 
             out_chunk = _chunk._Chunk(
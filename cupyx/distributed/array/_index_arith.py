@@ -1,37 +1,17 @@
 from __future__ import annotations
 
-import typing
+import functools
+import math
 from typing import Any
 
 
-def _extgcd(a: int, b: int) -> tuple[int, int]:
-    # Return (g, x) with g = gcd(a, b), ax + by = g - ax.
-
-    # c - ax - by = 0  ...  (1)
-    # d - au - bv = 0  ...  (2)
-    c, d = a, b
-    x, u = 1, 0
-    # y, v = 0, 1
-
-    # Apply Euclid's algorithm to (c, d)
-    while d:
-        r = c // d
-        # (1), (2) = (2), (1) - (2) * r
-        c, d = d, c - d * r
-        x, u = u, x - u * r
-        # y, v = v, y - u * r
-
-    return c, x
-
-
 def _crt(a1: int, n1: int, a2: int, n2: int) -> tuple[int, int] | None:
     # Return x, n with x == a1 (mod n1), x == a2 (mod n2), n == lcm(n1, n2).
     # Choose the minimum value for x with x >= max(a1, a2). Return None if no
     # solution exists.
     # Reference: https://en.wikipedia.org/wiki/Chinese_remainder_theorem#Existence_(constructive_proof)  # NOQA
 
-    # m1 * n1 + m2 * n2 == g
-    g, m1 = _extgcd(n1, n2)
+    g = math.gcd(n1, n2)
 
     # x == a1 == a2 (mod g)
     if (a2 - a1) % g != 0:
@@ -39,6 +19,9 @@ def _crt(a1: int, n1: int, a2: int, n2: int) -> tuple[int, int] | None:
 
     n = n1 * (n2 // g)
 
+    # m1 * (n1 // g) == 1 (mod n2 // g)
+    m1 = pow(n1 // g, -1, n2 // g)
+
     # x = a1 + (a2 - a1) // g * m1 * n1 % n
     x = a1 + (a2 - a1) // g * m1 % (n // n1) * n1
 
@@ -48,10 +31,42 @@ def _crt(a1: int, n1: int, a2: int, n2: int) -> tuple[int, int] | None:
     return x, n
 
 
+def _slice_indices(s: slice, length: int) -> tuple[int, int, int]:
+    # Equivalent to s.indices(length) for the slices handled here.
+    # Slices coming from `_normalize_index` already carry explicit, clamped
+    # start/stop/step values, so plain attribute access skips the clamping
+    # logic of slice.indices(), which dominates the cost of the index
+    # arithmetic in the all-reduce loops.
+    start = s.start
+    stop = s.stop
+    step = s.step
+    if (step is not None and step > 0
+            and start is not None and 0 <= start
+            and stop is not None and stop <= length):
+        return start, stop, step
+    return s.indices(length)
+
+
 def _slice_intersection(a: slice, b: slice, length: int) -> slice | None:
     # Return the intersection of slice a, b. None if they are disjoint.
-    a_start, a_stop, a_step = a.indices(length)
-    b_start, b_stop, b_step = b.indices(length)
+    a_norm = _slice_indices(a, length)
+    b_norm = _slice_indices(b, length)
+
+    # Bounding-box reject: most chunk pairs of a block-partitioned array do
+    # not overlap at all, so bail out before the CRT machinery runs.
+    if a_norm[1] <= b_norm[0] or b_norm[1] <= a_norm[0]:
+        return None
+
+    return _slice_intersection_norm(a_norm, b_norm)
+
+
+@functools.lru_cache(maxsize=4096)
+def _slice_intersection_norm(
+    a: tuple[int, int, int], b: tuple[int, int, int],
+) -> slice | None:
+    # The same chunk-pair slices recur across every reshard, hence the cache.
+    a_start, a_stop, a_step = a
+    b_start, b_stop, b_step = b
 
     crt_result = _crt(a_start, a_step, b_start, b_step)
     if crt_result is None:
@@ -68,8 +83,8 @@ def _slice_intersection(a: slice, b: slice, length: int) -> slice | None:
 def _index_for_subslice(a: slice, sub: slice, length: int) -> slice:
     # Return slice c such that array[a][c] == array[sub].
     # sub should be contained in a.
-    a_start, a_stop, a_step = a.indices(length)
-    sub_start, sub_stop, sub_step = sub.indices(length)
+    a_start, a_stop, a_step = _slice_indices(a, length)
+    sub_start, sub_stop, sub_step = _slice_indices(sub, length)
 
     c_start = (sub_start - a_start) // a_step
     # a_start + a_step * (c_stop - 1) < sub_stop
@@ -85,13 +100,14 @@ def _index_intersection(
 ) -> tuple[slice, ...] | None:
     # Return None if a, b are disjoint.
     assert len(a_idx) == len(b_idx)
-    result = tuple(_slice_intersection(a, b, length)
-                   for a, b, length in zip(a_idx, b_idx, shape))
-
-    if None in result:
-        return None
-    else:
-        return typing.cast(tuple[slice, ...], result)
+    ndim = len(a_idx)
+    result = [None] * ndim
+    for i in range(ndim):
+        intersection = _slice_intersection(a_idx[i], b_idx[i], shape[i])
+        if intersection is None:
+            return None
+        result[i] = intersection
+    return tuple(result)
 
 
 def _index_for_subindex(
@@ -99,9 +115,57 @@ def _index_for_subindex(
     shape: tuple[int, ...],
 ) -> tuple[slice, ...]:
     assert len(a_idx) == len(sub_idx)
+    ndim = len(a_idx)
+    result = [None] * ndim
+    for i in range(ndim):
+        result[i] = _index_for_subslice(a_idx[i], sub_idx[i], shape[i])
+    return tuple(result)
+
+
+# Cache for _paired_intersection, keyed by the identity of the index tuples
+# and pinning them so that the ids stay valid. Chunk indexes are immutable
+# and long-lived, and the same pairs recur on every pass over the chunk
+# pairs, so the slice math runs only once per pair.
+_paired_intersection_cache: dict[
+    tuple[int, int, tuple[int, ...]], tuple] = {}
+
 
-    return tuple(_index_for_subslice(a, sub, length)
-                 for a, sub, length in zip(a_idx, sub_idx, shape))
+def _paired_intersection(
+    a_idx: tuple[slice, ...], b_idx: tuple[slice, ...],
+    shape: tuple[int, ...],
+) -> tuple[tuple[slice, ...], tuple[slice, ...], tuple[slice, ...]] | None:
+    # Return (intersection, a_new_idx, b_new_idx) such that
+    # array[a_idx][a_new_idx] == array[b_idx][b_new_idx]
+    # == array[intersection]. None if a_idx, b_idx are disjoint.
+    cache = _paired_intersection_cache
+    key = (id(a_idx), id(b_idx), shape)
+    hit = cache.get(key)
+    if hit is not None and hit[0] is a_idx and hit[1] is b_idx:
+        return hit[2]
+
+    # Intersections are symmetric; the reverse sweep queries each pair in
+    # the opposite order, so reuse the forward result with the subindexes
+    # swapped.
+    hit = cache.get((id(b_idx), id(a_idx), shape))
+    if hit is not None and hit[0] is b_idx and hit[1] is a_idx:
+        value = hit[2]
+        if value is not None:
+            value = (value[0], value[2], value[1])
+        cache[key] = (a_idx, b_idx, value)
+        return value
+
+    intersection = _index_intersection(a_idx, b_idx, shape)
+    if intersection is None:
+        value = None
+    else:
+        value = (intersection,
+                 _index_for_subindex(a_idx, intersection, shape),
+                 _index_for_subindex(b_idx, intersection, shape))
+
+    if len(cache) >= 4096:
+        cache.clear()
+    cache[key] = (a_idx, b_idx, value)
+    return value
 
 
 def _shape_after_indexing(
@@ -110,14 +174,37 @@ def _shape_after_indexing(
 ) -> tuple[int, ...]:
     shape = list(outer_shape)
     for i in range(len(idx)):
-        start, stop, step = idx[i].indices(shape[i])
+        start, stop, step = _slice_indices(idx[i], shape[i])
         shape[i] = (stop - start - 1) // step + 1
     return tuple(shape)
 
 
+def _is_normalized_index(shape: tuple[int, ...], idx: Any) -> bool:
+    # True if idx is already in the form produced by `_normalize_index`.
+    # Index maps are frequently renormalized on reshard and construction,
+    # and after the first pass every index is in that form.
+    if not isinstance(idx, tuple) or len(idx) != len(shape):
+        return False
+    for s, length in zip(idx, shape):
+        if type(s) is not slice:
+            return False
+        start = s.start
+        stop = s.stop
+        step = s.step
+        if not (type(start) is int and type(stop) is int
+                and type(step) is int):
+            return False
+        if step <= 0 or not 0 <= start < stop <= length:
+            return False
+    return True
+
+
 def _normalize_index(shape: tuple[int, ...], idx: Any) -> tuple[slice, ...]:
     # Convert idx to type tuple[slice, ...] with length == ndim.
     # start, stop, step of each slice are set to a non-None value.
+    if _is_normalized_index(shape, idx):
+        return idx
+
     if not isinstance(idx, tuple):
         idx = (idx,)
 
@@ -158,7 +245,9 @@ def _normalize_index_map(
             idxs = [idxs]
 
         idxs = [_normalize_index(shape, idx) for idx in idxs]
-        idxs.sort()
+        # Decorate-sort on materialized integer triples, computed once per
+        # index; slices themselves do not support ordering.
+        idxs.sort(key=lambda idx: [(s.start, s.stop, s.step) for s in idx])
         new_index_map[dev] = idxs
 
     return new_index_map
@@ -5,7 +5,6 @@ from typing import Any
 
 from numpy.typing import DTypeLike
 
-import cupy._manipulation.dims as _manipulation_dims
 from cupyx.distributed.array import _array
 from cupyx.distributed.array import _chunk
 from cupyx.distributed.array import _data_transfer
@@ -61,10 +60,11 @@ def _execute(
                     out_chunk = _chunk._Chunk.create_placeholder(
                         out_shape, chunk.array.device, out_index)
                 else:
+                    out_array = kernel(chunk.array, axis=axis, dtype=dtype)
                     # We avoid 0D array because
                     # we expect data[idx] to return a view
-                    out_array = _manipulation_dims.atleast_1d(
-                        kernel(chunk.array, axis=axis, dtype=dtype))
+                    if out_array.ndim == 0:
+                        out_array = out_array.reshape((1,))
 
                     out_dtype = out_array.dtype
                     out_chunk = _chunk._Chunk(
@@ -78,8 +78,10 @@ def _execute(
 
                 for update, update_index in chunk.updates:
                     stream.wait_event(update.ready)
-                    out_update_array = _manipulation_dims.atleast_1d(
-                        kernel(update.array, axis=axis, dtype=dtype))
+                    out_update_array = kernel(
+                        update.array, axis=axis, dtype=dtype)
+                    if out_update_array.ndim == 0:
+                        out_update_array = out_update_array.reshape((1,))
                     out_dtype = out_update_array.dtype
 
                     out_update = _data_transfer._AsyncData(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import operator
+import string
 import warnings
 
 import numpy
@@ -13,11 +14,13 @@ except ImportError:
 
 import cupy
 from cupy._core import _accelerator
+from cupy._core import _scalar
 from cupy.cuda import cub
 from cupy.cuda import runtime
 from cupyx.scipy.sparse import _base
 from cupyx.scipy.sparse import _compressed
 from cupyx.scipy.sparse import _csc
+from cupyx.scipy.sparse import _index
 from cupyx.scipy.sparse import SparseEfficiencyWarning
 from cupyx.scipy.sparse import _util
 
@@ -103,6 +106,25 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
                     return csr_matrix(cupy.ones(self.shape, dtype=numpy.bool_))
                 else:
                     return csr_matrix(self.shape, dtype=numpy.bool_)
+            if self.dtype.kind != 'c':
+                scalar = self.dtype.type(other)
+                if not bool(op(self.dtype.type(0), scalar)):
+                    # The comparison is False at implicit zeros, so the
+                    # result is confined to the sparsity pattern of self;
+                    # evaluate op on the stored entries only instead of
+                    # broadcasting a 1x1 matrix over the whole shape
+                    # through binopt_csr. False results are pruned, as
+                    # the binopt kernel only emits nonzero outputs
+                    # (eliminate_zeros would go through cuSPARSE, which
+                    # does not take bool data).
+                    mask = op(self.data, scalar)
+                    kept = cupy.zeros(
+                        mask.size + 1, dtype=self.indptr.dtype)
+                    cupy.cumsum(mask, dtype=self.indptr.dtype,
+                                out=kept[1:])
+                    return csr_matrix(
+                        (mask[mask], self.indices[mask],
+                         kept[self.indptr]), shape=self.shape)
             indices = cupy.zeros((1,), dtype=numpy.int32)
             indptr = cupy.arange(2, dtype=numpy.int32)
             other = csr_matrix((data, indices, indptr), shape=(1, 1))
@@ -189,7 +211,10 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
                 return self._with_data(self.data * other)
             elif other.ndim == 1:
                 self.sum_duplicates()
-                other = cupy.asfortranarray(other)
+                if not other.flags.c_contiguous:
+                    # A 1-D operand only needs to be contiguous; skip the
+                    # asfortranarray dispatch in the common case.
+                    other = cupy.asfortranarray(other)
                 # need extra padding to ensure not stepping on the CUB bug,
                 # see cupy/cupy#3679 for discussion
                 is_cub_safe = (self.indptr.data.mem.size
@@ -223,7 +248,9 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
                     csrmm = cusparse.spmm
                 else:
                     raise AssertionError
-                return csrmm(self, cupy.asfortranarray(other))
+                if not other.flags.f_contiguous:
+                    other = cupy.asfortranarray(other)
+                return csrmm(self, other)
             else:
                 raise ValueError('could not interpret dimensions')
         else:
@@ -250,10 +277,15 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
             other = cupy.atleast_2d(other)
             other = cupy.broadcast_to(other, self.shape)
             check_shape_for_pointwise_op(self.shape, other.shape)
-            ret = self.tocoo()
-            ret.data = _cupy_divide_by_dense()(
-                ret.data, ret.row, ret.col, ret.shape[1], other)
-            return ret
+            if self.nnz == 0:
+                return self.copy()
+            # CSR already stores the column of each nonzero; expand indptr
+            # into the missing row array instead of materializing a full
+            # COO copy, and stay in CSR end-to-end.
+            row = _index._csr_indptr_to_coo_rows(self.nnz, self.indptr)
+            data = _cupy_divide_by_dense()(
+                self.data, row, self.indices, self.shape[1], other)
+            return self._with_data(data)
         elif _base.isspmatrix(other):
             # Note: If broadcasting is needed, an exception is raised here for
             # compatibility with SciPy, as SciPy does not support broadcasting
@@ -265,9 +297,12 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
                 dtype = numpy.promote_types(numpy.float64, dtype)
             # Note: The following implementation converts two sparse matrices
             # into dense matrices and then performs a point-wise division,
-            # which can use lots of memory.
+            # which can use lots of memory. The result is inherently dense
+            # (implicit zeros on both sides give 0/0 = nan), so dividing in
+            # place at least avoids a third full-size buffer.
             self_dense = self.todense().astype(dtype, copy=False)
-            return self_dense / other.todense()
+            self_dense /= other.todense()
+            return self_dense
         return NotImplemented
 
     def __rtruediv__(self, other):
@@ -358,6 +393,17 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
         else:
             x_len = min(x_len, values.size)
             x_data = values[:x_len]
+        # When every diagonal entry is already materialized, the new values
+        # can be stored in place, skipping the full csrgeam pass over
+        # self.nnz elements below.
+        self.sum_duplicates()
+        diag_idx = cupy.empty(x_len, dtype='i')
+        _cupy_csr_diagonal_indices()(k, rows, cols, self.indptr,
+                                     self.indices, diag_idx)
+        if bool((diag_idx >= 0).all()):
+            self.data[diag_idx] = x_data
+            return
+
         x_indices = cupy.arange(col_st, col_st + x_len, dtype='i')
         x_indptr = cupy.zeros((rows + 1,), dtype='i')
         x_indptr[row_st:row_st+x_len+1] = cupy.arange(x_len+1, dtype='i')
@@ -404,9 +450,22 @@ class csr_matrix(_compressed._compressed_sparse_matrix):
         if self.dtype.char not in 'fdFD':
             return csr2dense(self, order)
 
-        x = self.copy()
-        x.has_canonical_format = False  # need to enforce sum_duplicates
-        x.sum_duplicates()
+        if self.dtype.char in 'fd' and order == 'C':
+            # Scatter straight into a C-contiguous output. atomicAdd merges
+            # duplicates on the fly, so this needs neither the defensive
+            # copy with sum_duplicates nor the intermediate F-order buffer
+            # and its transpose copy of the cuSPARSE path.
+            return csr2dense(self, order)
+
+        if self.has_canonical_format:
+            # Already free of duplicates; no need to copy only to re-run
+            # sum_duplicates, as the cuSPARSE conversions below do not
+            # modify their input.
+            x = self
+        else:
+            x = self.copy()
+            x.has_canonical_format = False  # need to enforce sum_duplicates
+            x.sum_duplicates()
         if (cusparse.check_availability('sparseToDense')
                 and (not runtime.is_hip or (x.nnz > 0))):
             # On HIP, nnz=0 is problematic as of ROCm 4.2.0
@@ -609,10 +668,9 @@ def check_shape_for_pointwise_op(a_shape, b_shape, allow_broadcasting=True):
 
 
 def multiply_by_scalar(sp, a):
-    data = sp.data * a
-    indices = sp.indices.copy()
-    indptr = sp.indptr.copy()
-    return csr_matrix((data, indices, indptr), shape=sp.shape)
+    # The structure is unchanged under scalar multiplication, so the result
+    # can share indices/indptr with the input instead of copying them.
+    return sp._with_data(sp.data * a, copy=False)
 
 
 def multiply_by_dense(sp, dn):
@@ -634,9 +692,17 @@ def multiply_by_dense(sp, dn):
         if n > sp_n:
             indptr *= n
 
+    if nnz == 0:
+        return csr_matrix((data, indices, indptr), shape=(m, n))
+
+    # One load per nonzero to find its row, instead of a per-thread binary
+    # search over indptr inside the kernel
+    out_row = _index._csr_indptr_to_coo_rows(nnz, indptr)
+
     # out = sp * dn
     cupy_multiply_by_dense()(sp.data, sp.indptr, sp.indices, sp_m, sp_n,
-                             dn, dn_m, dn_n, indptr, m, n, data, indices)
+                             dn, dn_m, dn_n, indptr, out_row, m, n,
+                             data, indices)
 
     return csr_matrix((data, indices, indptr), shape=(m, n))
 
@@ -686,12 +752,12 @@ def cupy_multiply_by_dense():
         raw S SP_DATA, raw I SP_INDPTR, raw I SP_INDICES,
         int32 SP_M, int32 SP_N,
         raw D DN_DATA, int32 DN_M, int32 DN_N,
-        raw I OUT_INDPTR, int32 OUT_M, int32 OUT_N
+        raw I OUT_INDPTR, raw I OUT_ROW, int32 OUT_M, int32 OUT_N
         ''',
         'O OUT_DATA, I OUT_INDICES',
         '''
         int i_out = i;
-        int m_out = get_row_id(i_out, 0, OUT_M - 1, &(OUT_INDPTR[0]));
+        int m_out = OUT_ROW[i_out];
         int i_sp = i_out;
         if (OUT_M > SP_M && SP_M == 1) {
             i_sp -= OUT_INDPTR[m_out];
@@ -715,7 +781,6 @@ def cupy_multiply_by_dense():
         OUT_INDICES = n_out;
         ''',
         'cupyx_scipy_sparse_csr_multiply_by_dense',
-        preamble=_GET_ROW_ID_
     )
 
 
@@ -753,18 +818,34 @@ def multiply_by_csr(a, b):
         c_indptr = a.indptr.copy()
         if n > a_n:
             c_indptr *= n
+    if c_nnz == 0:
+        c_indptr = cupy.zeros(m+1, dtype=a.indptr.dtype)
+        return csr_matrix((c_data, c_indices, c_indptr), shape=(m, n))
+
     flags = cupy.zeros(c_nnz+1, dtype=a.indices.dtype)
     nnz_each_row = cupy.zeros(m+1, dtype=a.indptr.dtype)
 
     # compute c = a * b where necessary and get sparsity pattern of matrix d
-    cupy_multiply_by_csr_step1()(
-        a.data, a.indptr, a.indices, a_m, a_n,
-        b.data, b.indptr, b.indices, b_m, b_n,
-        c_indptr, m, n, c_data, c_indices, flags, nnz_each_row)
+    if not _multiply_by_csr_hash(a, b, m, n, c_indptr, c_data, c_indices,
+                                 flags, nnz_each_row):
+        # One load per nonzero to find its row, instead of a per-thread
+        # binary search over indptr inside the kernel
+        c_row = _index._csr_indptr_to_coo_rows(c_nnz, c_indptr)
+
+        cupy_multiply_by_csr_step1()(
+            a.data, a.indptr, a.indices, a_m, a_n,
+            b.data, b.indptr, b.indices, b_m, b_n,
+            c_indptr, c_row, m, n, c_data, c_indices, flags, nnz_each_row)
 
-    flags = cupy.cumsum(flags, dtype=a.indptr.dtype)
     d_indptr = cupy.cumsum(nnz_each_row, dtype=a.indptr.dtype)
     d_nnz = int(d_indptr[-1])
+    if d_nnz == c_nnz:
+        # Every position of c found a matching element in b, which is always
+        # the case when a and b share their sparsity pattern. c is already
+        # compact, so skip the full-length scan and the compaction pass.
+        return csr_matrix((c_data, c_indices, d_indptr), shape=(m, n))
+
+    flags = cupy.cumsum(flags, dtype=a.indptr.dtype)
     d_data = cupy.empty(d_nnz, dtype=dtype)
     d_indices = cupy.empty(d_nnz, dtype=a.indices.dtype)
 
@@ -780,12 +861,12 @@ def cupy_multiply_by_csr_step1():
         '''
         raw A A_DATA, raw I A_INDPTR, raw I A_INDICES, int32 A_M, int32 A_N,
         raw B B_DATA, raw I B_INDPTR, raw I B_INDICES, int32 B_M, int32 B_N,
-        raw I C_INDPTR, int32 C_M, int32 C_N
+        raw I C_INDPTR, raw I C_ROW, int32 C_M, int32 C_N
         ''',
         'C C_DATA, I C_INDICES, raw I FLAGS, raw I NNZ_EACH_ROW',
         '''
         int i_c = i;
-        int m_c = get_row_id(i_c, 0, C_M - 1, &(C_INDPTR[0]));
+        int m_c = C_ROW[i_c];
 
         int i_a = i;
         if (C_M > A_M && A_M == 1) {
@@ -816,7 +897,7 @@ def cupy_multiply_by_csr_step1():
         }
         ''',
         'cupyx_scipy_sparse_csr_multiply_by_csr_step1',
-        preamble=_GET_ROW_ID_ + _FIND_INDEX_HOLDING_COL_IN_ROW_
+        preamble=_FIND_INDEX_HOLDING_COL_IN_ROW_
     )
 
 
@@ -836,6 +917,129 @@ def cupy_multiply_by_csr_step2():
     )
 
 
+# Upper bound on the shared-memory hash table of the kernel below; at
+# 8 bytes per entry this stays within the 48 KB static limit.
+_CSR_HASH_TABLE_MAX_SIZE = 4096
+
+_MULTIPLY_BY_CSR_HASH_KERNEL_ = '''
+extern "C" __global__ void cupyx_scipy_sparse_csr_multiply_by_csr_hash(
+        const ${T}* A_DATA, const int* A_INDPTR, const int* A_INDICES,
+        int A_M, int A_N,
+        const ${T}* B_DATA, const int* B_INDPTR, const int* B_INDICES,
+        int B_M, int B_N,
+        const int* C_INDPTR, int C_M, int C_N,
+        ${T}* C_DATA, int* C_INDICES, int* FLAGS, int* NNZ_EACH_ROW,
+        int TABLE_SIZE) {
+    // One block per row of c. The row of b is staged in a shared-memory
+    // open-addressing hash table, turning the per-element binary search
+    // of the fallback kernel into O(1) probes.
+    extern __shared__ int table[];
+    int* keys = table;
+    int* vals = table + TABLE_SIZE;
+    int mask = TABLE_SIZE - 1;
+    int m_c = blockIdx.x;
+
+    for (int t = threadIdx.x; t < TABLE_SIZE; t += blockDim.x) {
+        keys[t] = -1;
+    }
+    __syncthreads();
+
+    int m_b = m_c;
+    if (C_M > B_M && B_M == 1) {
+        m_b = 0;
+    }
+    for (int j = B_INDPTR[m_b] + threadIdx.x; j < B_INDPTR[m_b + 1];
+            j += blockDim.x) {
+        int col = B_INDICES[j];
+        int h = (int)(((unsigned int)col * 2654435761u) & (unsigned int)mask);
+        while (atomicCAS(&keys[h], -1, col) != -1) {
+            h = (h + 1) & mask;
+        }
+        vals[h] = j;
+    }
+    __syncthreads();
+
+    for (int i = C_INDPTR[m_c] + threadIdx.x; i < C_INDPTR[m_c + 1];
+            i += blockDim.x) {
+        int i_a = i;
+        if (C_M > A_M && A_M == 1) {
+            i_a -= C_INDPTR[m_c];
+        }
+        if (C_N > A_N && A_N == 1) {
+            i_a /= C_N;
+        }
+        int n_c = A_INDICES[i_a];
+        if (C_N > A_N && A_N == 1) {
+            n_c = i % C_N;
+        }
+        int n_b = n_c;
+        if (C_N > B_N && B_N == 1) {
+            n_b = 0;
+        }
+        int i_b = -1;
+        int h = (int)(((unsigned int)n_b * 2654435761u) & (unsigned int)mask);
+        while (true) {
+            int key = keys[h];
+            if (key == n_b) {
+                i_b = vals[h];
+                break;
+            }
+            if (key == -1) {
+                break;
+            }
+            h = (h + 1) & mask;
+        }
+        if (i_b >= 0) {
+            atomicAdd(&NNZ_EACH_ROW[m_c + 1], 1);
+            FLAGS[i + 1] = 1;
+            C_DATA[i] = A_DATA[i_a] * B_DATA[i_b];
+            C_INDICES[i] = n_c;
+        }
+    }
+}
+'''
+
+
+@cupy._util.memoize(for_each_device=True)
+def cupy_multiply_by_csr_hash(dtype):
+    return cupy.RawKernel(
+        string.Template(_MULTIPLY_BY_CSR_HASH_KERNEL_).substitute(
+            T=_scalar.get_typename(dtype)),
+        'cupyx_scipy_sparse_csr_multiply_by_csr_hash')
+
+
+def _multiply_by_csr_hash(a, b, m, n, c_indptr, c_data, c_indices,
+                          flags, nnz_each_row):
+    # Run the hash-table variant of step1 when it pays off: dense enough
+    # rows for the binary searches to dominate, and rows of b small enough
+    # for the table to fit in shared memory. Returns False when the caller
+    # should fall back to cupy_multiply_by_csr_step1.
+    dtype = c_data.dtype
+    if dtype.kind not in 'iuf':
+        return False
+    if c_data.size < 16 * m:
+        return False
+    b_max_row_nnz = int(cupy.diff(b.indptr).max())
+    if b_max_row_nnz == 0:
+        return False
+    table_size = 1 << (2 * b_max_row_nnz - 1).bit_length()
+    if table_size > _CSR_HASH_TABLE_MAX_SIZE:
+        return False
+
+    a_m, a_n = a.shape
+    b_m, b_n = b.shape
+    a_data = a.data.astype(dtype, copy=False)
+    b_data = b.data.astype(dtype, copy=False)
+    kern = cupy_multiply_by_csr_hash(dtype)
+    kern((m,), (256,),
+         (a_data, a.indptr, a.indices, numpy.int32(a_m), numpy.int32(a_n),
+          b_data, b.indptr, b.indices, numpy.int32(b_m), numpy.int32(b_n),
+          c_indptr, numpy.int32(m), numpy.int32(n),
+          c_data, c_indices, flags, nnz_each_row, numpy.int32(table_size)),
+         shared_mem=8 * table_size)
+    return True
+
+
 _BINOPT_MAX_ = '''
 __device__ inline O binopt(T in1, T in2) {
     return max(in1, in2);
@@ -878,8 +1082,41 @@ __device__ inline O binopt(T in1, T in2) {
 '''
 
 
+# Preamble and output dtype per op, looked up instead of rebuilt on
+# every binopt_csr call. None means the output keeps the promoted input
+# dtype.
+_BINOPT_PREAMBLES = {
+    '_maximum_': _GET_ROW_ID_ + _BINOPT_MAX_,
+    '_minimum_': _GET_ROW_ID_ + _BINOPT_MIN_,
+    '_eq_': _GET_ROW_ID_ + _BINOPT_EQ_,
+    '_ne_': _GET_ROW_ID_ + _BINOPT_NE_,
+    '_lt_': _GET_ROW_ID_ + _BINOPT_LT_,
+    '_gt_': _GET_ROW_ID_ + _BINOPT_GT_,
+    '_le_': _GET_ROW_ID_ + _BINOPT_LE_,
+    '_ge_': _GET_ROW_ID_ + _BINOPT_GE_,
+}
+_BINOPT_OUT_DTYPES = {
+    '_maximum_': None,
+    '_minimum_': None,
+    '_eq_': numpy.bool_,
+    '_ne_': numpy.bool_,
+    '_lt_': numpy.bool_,
+    '_gt_': numpy.bool_,
+    '_le_': numpy.bool_,
+    '_ge_': numpy.bool_,
+}
+
+
 def binopt_csr(a, b, op_name):
     check_shape_for_pointwise_op(a.shape, b.shape)
+    if a.shape == b.shape and a.shape[0] > 0 and not runtime.is_hip:
+        in_dtype = numpy.promote_types(a.dtype, b.dtype)
+        if in_dtype.kind in 'biuf':
+            # Without broadcasting, each output row is the merge of two
+            # sorted column lists; a warp-per-row merge avoids the
+            # per-nonzero binary searches and scratch buffers of the
+            # generic kernels below.
+            return _binopt_csr_merge(a, b, op_name, in_dtype)
     a_m, a_n = a.shape
     b_m, b_n = b.shape
     m, n = max(a_m, b_m), max(a_n, b_n)
@@ -894,33 +1131,12 @@ def binopt_csr(a, b, op_name):
     in_dtype = numpy.promote_types(a.dtype, b.dtype)
     a_data = a.data.astype(in_dtype, copy=False)
     b_data = b.data.astype(in_dtype, copy=False)
-    funcs = _GET_ROW_ID_
-    if op_name == '_maximum_':
-        funcs += _BINOPT_MAX_
-        out_dtype = in_dtype
-    elif op_name == '_minimum_':
-        funcs += _BINOPT_MIN_
-        out_dtype = in_dtype
-    elif op_name == '_eq_':
-        funcs += _BINOPT_EQ_
-        out_dtype = numpy.bool_
-    elif op_name == '_ne_':
-        funcs += _BINOPT_NE_
-        out_dtype = numpy.bool_
-    elif op_name == '_lt_':
-        funcs += _BINOPT_LT_
-        out_dtype = numpy.bool_
-    elif op_name == '_gt_':
-        funcs += _BINOPT_GT_
-        out_dtype = numpy.bool_
-    elif op_name == '_le_':
-        funcs += _BINOPT_LE_
-        out_dtype = numpy.bool_
-    elif op_name == '_ge_':
-        funcs += _BINOPT_GE_
-        out_dtype = numpy.bool_
-    else:
+    funcs = _BINOPT_PREAMBLES.get(op_name)
+    if funcs is None:
         raise ValueError('invalid op_name: {}'.format(op_name))
+    out_dtype = _BINOPT_OUT_DTYPES[op_name]
+    if out_dtype is None:
+        out_dtype = in_dtype
     a_tmp_data = cupy.empty(a_nnz, dtype=out_dtype)
     b_tmp_data = cupy.empty(b_nnz, dtype=out_dtype)
     a_tmp_indices = cupy.empty(a_nnz, dtype=a.indices.dtype)
@@ -936,14 +1152,20 @@ def binopt_csr(a, b, op_name):
     a_info = cupy.cumsum(a_info, dtype=a_info.dtype)
     b_info = cupy.cumsum(b_info, dtype=b_info.dtype)
     c_indptr = cupy.cumsum(c_indptr, dtype=c_indptr.dtype)
-    c_nnz = int(c_indptr[-1])
-    c_indices = cupy.empty(c_nnz, dtype=a.indices.dtype)
-    c_data = cupy.empty(c_nnz, dtype=out_dtype)
+    # Allocating the output at its worst-case size lets step2 be queued
+    # right away, so the one device-to-host sync for the nnz happens
+    # only after every kernel is in flight. The returned matrix holds
+    # views into the over-allocated arrays; indptr bounds the valid
+    # entries as usual.
+    c_indices = cupy.empty(_size, dtype=a.indices.dtype)
+    c_data = cupy.empty(_size, dtype=out_dtype)
     cupy_binopt_csr_step2(op_name)(
         a_info, a_valid, a_tmp_indices, a_tmp_data, a_nnz,
         b_info, b_valid, b_tmp_indices, b_tmp_data, b_nnz,
         c_indices, c_data, size=_size)
-    return csr_matrix((c_data, c_indices, c_indptr), shape=(m, n))
+    c_nnz = int(c_indptr[-1])
+    return csr_matrix(
+        (c_data[:c_nnz], c_indices[:c_nnz], c_indptr), shape=(m, n))
 
 
 @cupy._util.memoize(for_each_device=True)
@@ -1128,32 +1350,249 @@ def cupy_binopt_csr_step2(op_name):
     )
 
 
+_BINOPT_MERGE_OPS = {
+    '_maximum_': 'in1 > in2 ? in1 : in2',
+    '_minimum_': 'in1 < in2 ? in1 : in2',
+    '_eq_': 'in1 == in2',
+    '_ne_': 'in1 != in2',
+    '_lt_': 'in1 < in2',
+    '_gt_': 'in1 > in2',
+    '_le_': 'in1 <= in2',
+    '_ge_': 'in1 >= in2',
+}
+
+_BINOPT_CSR_MERGE_KERNEL_ = '''
+__device__ inline ${O} binopt(${T} in1, ${T} in2) {
+    return (${EXPR});
+}
+
+extern "C" __global__ void ${NAME}(
+        const int* A_INDPTR, const int* A_INDICES, const ${T}* A_DATA,
+        const int* B_INDPTR, const int* B_INDICES, const ${T}* B_DATA,
+        int* C_INDPTR, int* C_INDICES, ${O}* C_DATA) {
+    // One warp per row. Lanes cooperatively walk the merge of the two
+    // sorted column lists of the row: each merge position is located by a
+    // diagonal (merge-path) search, matched columns are emitted once by
+    // the a-side lane, and per-row output offsets come from a warp ballot
+    // instead of atomics. The symbolic pass (NUMERIC == 0) only counts
+    // kept entries per row; the numeric pass recomputes the merge and
+    // writes at the offsets given by the scanned C_INDPTR.
+    const int row = blockIdx.x;
+    const int lane = threadIdx.x;
+    const int a_start = A_INDPTR[row];
+    const int a_len = A_INDPTR[row + 1] - a_start;
+    const int b_start = B_INDPTR[row];
+    const int b_len = B_INDPTR[row + 1] - b_start;
+    const int total = a_len + b_len;
+    int cursor = ${NUMERIC} ? C_INDPTR[row] : 0;
+    for (int base = 0; base < total; base += 32) {
+        int k = base + lane;
+        int keep = 0;
+        int col = 0;
+        ${O} out = static_cast<${O}>(0);
+        if (k < total) {
+            int lo = k - b_len;
+            if (lo < 0) lo = 0;
+            int hi = k;
+            if (hi > a_len) hi = a_len;
+            while (lo < hi) {
+                int mid = (lo + hi + 1) / 2;
+                if (A_INDICES[a_start + mid - 1]
+                        <= B_INDICES[b_start + k - mid]) {
+                    lo = mid;
+                } else {
+                    hi = mid - 1;
+                }
+            }
+            int ai = lo;
+            int bj = k - lo;
+            bool take_a = (bj >= b_len)
+                || (ai < a_len
+                    && A_INDICES[a_start + ai] <= B_INDICES[b_start + bj]);
+            if (take_a) {
+                col = A_INDICES[a_start + ai];
+                bool hit = (bj < b_len) && (B_INDICES[b_start + bj] == col);
+                ${T} b_val = hit ? B_DATA[b_start + bj]
+                                 : static_cast<${T}>(0);
+                out = binopt(A_DATA[a_start + ai], b_val);
+                keep = (out != static_cast<${O}>(0));
+            } else {
+                col = B_INDICES[b_start + bj];
+                // A matching a-side element occupies the preceding merge
+                // position and has already emitted this column.
+                if (ai == 0 || A_INDICES[a_start + ai - 1] != col) {
+                    out = binopt(static_cast<${T}>(0),
+                                 B_DATA[b_start + bj]);
+                    keep = (out != static_cast<${O}>(0));
+                }
+            }
+        }
+        unsigned int vote = __ballot_sync(0xffffffffu, keep);
+        if (${NUMERIC} && keep) {
+            int dst = cursor + __popc(vote & ((1u << lane) - 1u));
+            C_INDICES[dst] = col;
+            C_DATA[dst] = out;
+        }
+        cursor += __popc(vote);
+    }
+    if (!${NUMERIC} && lane == 0) {
+        C_INDPTR[row + 1] = cursor;
+    }
+}
+'''
+
+
+@cupy._util.memoize(for_each_device=True)
+def _cupy_binopt_csr_merge(op_name, in_dtype, out_dtype, numeric):
+    name = ('cupyx_scipy_sparse_csr_binopt' + op_name
+            + ('merge_numeric' if numeric else 'merge_symbolic'))
+    return cupy.RawKernel(
+        string.Template(_BINOPT_CSR_MERGE_KERNEL_).substitute(
+            NAME=name, T=_scalar.get_typename(in_dtype),
+            O=_scalar.get_typename(out_dtype),
+            EXPR=_BINOPT_MERGE_OPS[op_name],
+            NUMERIC=int(numeric)),
+        name)
+
+
+def _binopt_csr_merge(a, b, op_name, in_dtype):
+    m, n = a.shape
+    if op_name in ('_maximum_', '_minimum_'):
+        out_dtype = in_dtype
+    elif op_name in _BINOPT_MERGE_OPS:
+        out_dtype = numpy.dtype(numpy.bool_)
+    else:
+        raise ValueError('invalid op_name: {}'.format(op_name))
+    a_data = a.data.astype(in_dtype, copy=False)
+    b_data = b.data.astype(in_dtype, copy=False)
+    c_indptr = cupy.zeros(m + 1, dtype=a.indptr.dtype)
+    kern = _cupy_binopt_csr_merge(op_name, in_dtype, out_dtype, False)
+    # The last two arguments are unused in the symbolic pass.
+    kern((m,), (32,),
+         (a.indptr, a.indices, a_data, b.indptr, b.indices, b_data,
+          c_indptr, c_indptr, c_indptr))
+    c_indptr = cupy.cumsum(c_indptr, dtype=c_indptr.dtype)
+    # Worst-case sizing keeps the numeric pass off the critical path:
+    # the nnz is read back only once both passes are queued, and the
+    # result holds views into the over-allocated arrays.
+    nnz_ub = a.nnz + b.nnz
+    c_indices = cupy.empty(nnz_ub, dtype=a.indices.dtype)
+    c_data = cupy.empty(nnz_ub, dtype=out_dtype)
+    kern = _cupy_binopt_csr_merge(op_name, in_dtype, out_dtype, True)
+    kern((m,), (32,),
+         (a.indptr, a.indices, a_data, b.indptr, b.indices, b_data,
+          c_indptr, c_indices, c_data))
+    c_nnz = int(c_indptr[-1])
+    return csr_matrix(
+        (c_data[:c_nnz], c_indices[:c_nnz], c_indptr), shape=(m, n))
+
+
 def csr2dense(a, order):
-    out = cupy.zeros(a.shape, dtype=a.dtype, order=order)
     m, n = a.shape
-    kern = _cupy_csr2dense(a.dtype)
-    kern(m, n, a.indptr, a.indices, a.data, (order == 'C'), out)
+    # Peek at the cached flag only; computing it would cost a kernel of
+    # its own. Rows known free of duplicates can be written with plain
+    # stores instead of atomicAdd.
+    plain_store = bool(getattr(a, '_has_canonical_format', False))
+    if plain_store and order == 'C' and m > 0 and n > 0 and a.nnz > 0:
+        # Canonical rows are sorted, so every output element can be
+        # produced in one pass by a per-column binary search over the
+        # row, skipping the m*n zero-fill that otherwise dominates the
+        # traffic at low density.
+        out = cupy.empty((m, n), dtype=a.dtype)
+        _cupy_csr2dense_fused(a.dtype)(
+            (m,), (128,),
+            (numpy.int32(m), numpy.int32(n), a.indptr, a.indices, a.data,
+             out))
+        return out
+    out = cupy.zeros(a.shape, dtype=a.dtype, order=order)
+    if m == 0 or a.nnz == 0:
+        return out
+    kern = _cupy_csr2dense(a.dtype, plain_store)
+    kern((m,), (128,),
+         (numpy.int32(m), numpy.int32(n), a.indptr, a.indices, a.data,
+          numpy.int32(order == 'C'), out))
     return out
 
 
+_CSR2DENSE_KERNEL_ = '''
+${INCLUDE}
+extern "C" __global__ void cupyx_scipy_sparse_csr2dense(
+        int M, int N, const int* INDPTR, const int* INDICES,
+        const ${T}* DATA, int C_ORDER, ${T}* OUT) {
+    // One block per row: indptr is read once per block and the row's
+    // INDICES/DATA are streamed with coalesced loads, instead of one
+    // thread per nonzero recovering its row with a binary search over
+    // indptr.
+    int row = blockIdx.x;
+    int start = INDPTR[row];
+    int end = INDPTR[row + 1];
+    for (int j = start + threadIdx.x; j < end; j += blockDim.x) {
+        int col = INDICES[j];
+        int index = C_ORDER ? col + N * row : row + M * col;
+        ${OP}
+    }
+}
+'''
+
+
 @cupy._util.memoize(for_each_device=True)
-def _cupy_csr2dense(dtype):
+def _cupy_csr2dense(dtype, plain_store):
     if dtype == '?':
-        op = "if (DATA) OUT[index] = true;"
+        include = ''
+        op = 'if (DATA[j]) OUT[index] = true;'
+    elif plain_store:
+        include = ''
+        op = 'OUT[index] = DATA[j];'
     else:
-        op = "atomicAdd(&OUT[index], DATA);"
+        include = '#include <cupy/atomics.cuh>'
+        op = 'atomicAdd(&OUT[index], DATA[j]);'
+
+    return cupy.RawKernel(
+        string.Template(_CSR2DENSE_KERNEL_).substitute(
+            INCLUDE=include, T=_scalar.get_typename(dtype), OP=op),
+        'cupyx_scipy_sparse_csr2dense')
+
+
+_CSR2DENSE_FUSED_KERNEL_ = '''
+extern "C" __global__ void cupyx_scipy_sparse_csr2dense_fused(
+        int M, int N, const int* INDPTR, const int* INDICES,
+        const ${T}* DATA, ${T}* OUT) {
+    // One block per row, C order, sorted duplicate-free rows. Threads
+    // stride over the columns and write either the matching stored
+    // value or zero, so the dense output is written exactly once and no
+    // separate zero-fill pass is needed. The searched row segment of
+    // INDICES is short and rereads stay in cache.
+    int row = blockIdx.x;
+    int start = INDPTR[row];
+    int end = INDPTR[row + 1];
+    for (int col = threadIdx.x; col < N; col += blockDim.x) {
+        int lo = start;
+        int hi = end - 1;
+        ${T} val = static_cast<${T}>(0);
+        while (lo <= hi) {
+            int mid = (lo + hi) / 2;
+            int c = INDICES[mid];
+            if (c == col) {
+                val = DATA[mid];
+                break;
+            } else if (c < col) {
+                lo = mid + 1;
+            } else {
+                hi = mid - 1;
+            }
+        }
+        OUT[col + N * row] = val;
+    }
+}
+'''
 
-    return cupy.ElementwiseKernel(
-        'int32 M, int32 N, raw I INDPTR, I INDICES, T DATA, bool C_ORDER',
-        'raw T OUT',
-        '''
-        int row = get_row_id(i, 0, M - 1, &(INDPTR[0]));
-        int col = INDICES;
-        int index = C_ORDER ? col + N * row : row + M * col;
-        ''' + op,
-        'cupyx_scipy_sparse_csr2dense',
-        preamble=_GET_ROW_ID_
-    )
+
+@cupy._util.memoize(for_each_device=True)
+def _cupy_csr2dense_fused(dtype):
+    return cupy.RawKernel(
+        string.Template(_CSR2DENSE_FUSED_KERNEL_).substitute(
+            T=_scalar.get_typename(dtype)),
+        'cupyx_scipy_sparse_csr2dense_fused')
 
 
 def dense2csr(a):
@@ -1166,18 +1605,82 @@ def dense2csr(a):
             return cusparse.dense2csr(a)
     m, n = a.shape
     a = cupy.ascontiguousarray(a)
+    if runtime.is_hip:
+        # The warp-ballot kernels below are CUDA-only.
+        indptr = cupy.zeros(m + 1, dtype=numpy.int32)
+        info = cupy.zeros(m * n + 1, dtype=numpy.int32)
+        cupy_dense2csr_step1()(m, n, a, indptr, info)
+        indptr = cupy.cumsum(indptr, dtype=numpy.int32)
+        info = cupy.cumsum(info, dtype=numpy.int32)
+        nnz = int(indptr[-1])
+        indices = cupy.empty(nnz, dtype=numpy.int32)
+        data = cupy.empty(nnz, dtype=a.dtype)
+        cupy_dense2csr_step2()(m, n, a, info, indices, data)
+        return csr_matrix((data, indices, indptr), shape=(m, n))
+    # One warp per row, so write offsets come from a warp ballot and only
+    # the m+1 row counters need a prefix sum, not an m*n info array.
     indptr = cupy.zeros(m + 1, dtype=numpy.int32)
-    info = cupy.zeros(m * n + 1, dtype=numpy.int32)
-    cupy_dense2csr_step1()(m, n, a, indptr, info)
+    if m > 0:
+        # The last two arguments are unused in the symbolic pass.
+        _cupy_dense2csr(a.dtype, False)(
+            (m,), (32,),
+            (numpy.int32(m), numpy.int32(n), a, indptr, indptr, a))
     indptr = cupy.cumsum(indptr, dtype=numpy.int32)
-    info = cupy.cumsum(info, dtype=numpy.int32)
     nnz = int(indptr[-1])
     indices = cupy.empty(nnz, dtype=numpy.int32)
     data = cupy.empty(nnz, dtype=a.dtype)
-    cupy_dense2csr_step2()(m, n, a, info, indices, data)
+    if m > 0:
+        _cupy_dense2csr(a.dtype, True)(
+            (m,), (32,),
+            (numpy.int32(m), numpy.int32(n), a, indptr, indices, data))
     return csr_matrix((data, indices, indptr), shape=(m, n))
 
 
+_DENSE2CSR_KERNEL_ = '''
+extern "C" __global__ void ${NAME}(
+        int M, int N, const ${T}* A, int* INDPTR,
+        int* INDICES, ${T}* DATA) {
+    // One warp per row. The symbolic pass (NUMERIC == 0) counts the
+    // nonzeros of the row into INDPTR[row + 1]; the numeric pass writes
+    // indices/data at offsets obtained from a warp ballot over the
+    // nonzero predicates, starting at the scanned INDPTR[row].
+    const int row = blockIdx.x;
+    const int lane = threadIdx.x;
+    int cursor = ${NUMERIC} ? INDPTR[row] : 0;
+    for (int base = 0; base < N; base += 32) {
+        int col = base + lane;
+        int keep = 0;
+        ${T} val = static_cast<${T}>(0);
+        if (col < N) {
+            val = A[(long long)row * N + col];
+            keep = (val != static_cast<${T}>(0));
+        }
+        unsigned int vote = __ballot_sync(0xffffffffu, keep);
+        if (${NUMERIC} && keep) {
+            int dst = cursor + __popc(vote & ((1u << lane) - 1u));
+            INDICES[dst] = col;
+            DATA[dst] = val;
+        }
+        cursor += __popc(vote);
+    }
+    if (!${NUMERIC} && lane == 0) {
+        INDPTR[row + 1] = cursor;
+    }
+}
+'''
+
+
+@cupy._util.memoize(for_each_device=True)
+def _cupy_dense2csr(dtype, numeric):
+    name = ('cupyx_scipy_sparse_dense2csr_'
+            + ('numeric' if numeric else 'symbolic'))
+    return cupy.RawKernel(
+        string.Template(_DENSE2CSR_KERNEL_).substitute(
+            NAME=name, T=_scalar.get_typename(dtype),
+            NUMERIC=int(numeric)),
+        name)
+
+
 @cupy._util.memoize(for_each_device=True)
 def cupy_dense2csr_step1():
     return cupy.ElementwiseKernel(
@@ -1234,3 +1737,22 @@ def _cupy_csr_diagonal():
         'cupyx_scipy_sparse_csr_diagonal',
         preamble=_FIND_INDEX_HOLDING_COL_IN_ROW_
     )
+
+
+@cupy._util.memoize(for_each_device=True)
+def _cupy_csr_diagonal_indices():
+    return cupy.ElementwiseKernel(
+        'int32 k, int32 rows, int32 cols, raw I indptr, raw I indices',
+        'I j',
+        '''
+        int row = i;
+        int col = i;
+        if (k < 0) row -= k;
+        if (k > 0) col += k;
+        if (row >= rows || col >= cols) return;
+        j = find_index_holding_col_in_row(row, col,
+            &(indptr[0]), &(indices[0]));
+        ''',
+        'cupyx_scipy_sparse_csr_diagonal_indices',
+        preamble=_FIND_INDEX_HOLDING_COL_IN_ROW_
+    )
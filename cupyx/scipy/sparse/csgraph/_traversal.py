@@ -9,6 +9,27 @@ except ModuleNotFoundError:
     pylibcugraph_available = False
 
 
+_resource_handles = {}
+
+
+def _get_resource_handle():
+    # Creating a pylibcugraph resource handle spins up a RAFT handle,
+    # which costs far more than a small traversal; keep one per device.
+    # A RAFT handle is bound to the device it was created on, so the
+    # cache is keyed on the current device rather than shared globally.
+    # Older pylibcugraph without ResourceHandle gets None, which makes
+    # it create a transient handle internally as before.
+    dev_id = cupy.cuda.runtime.getDevice()
+    handle = _resource_handles.get(dev_id)
+    if handle is None:
+        try:
+            handle = pylibcugraph.ResourceHandle()
+        except AttributeError:
+            return None
+        _resource_handles[dev_id] = handle
+    return handle
+
+
 def connected_components(csgraph, directed=True, connection='weak',
                          return_labels=True):
     """Analyzes the connected components of a sparse graph
@@ -60,11 +81,18 @@ def connected_components(csgraph, directed=True, connection='weak',
             offsets=csgraph.indptr, indices=csgraph.indices, weights=None,
             num_verts=m, num_edges=csgraph.nnz, labels=labels)
     else:
+        # Only the symmetrized structure matters here — the weights are
+        # never handed to pylibcugraph — so run the csr add on a
+        # structural copy with unit float32 data instead of the caller's
+        # (possibly float64 or bool) values. The copy shares
+        # indices/indptr with the input, and csr + csc yields csr, so no
+        # re-wrapping is needed either.
+        ones = cupy.ones(csgraph.nnz, dtype=cupy.float32)
+        csgraph = cupyx.scipy.sparse.csr_matrix(
+            (ones, csgraph.indices, csgraph.indptr), shape=csgraph.shape)
         csgraph += csgraph.T
-        if not cupyx.scipy.sparse.isspmatrix_csr(csgraph):
-            csgraph = cupyx.scipy.sparse.csr_matrix(csgraph)
         _, labels = pylibcugraph.weakly_connected_components(
-            resource_handle=None,
+            resource_handle=_get_resource_handle(),
             graph=None,
             indices=csgraph.indices,
             offsets=csgraph.indptr,
@@ -79,7 +107,17 @@ def connected_components(csgraph, directed=True, connection='weak',
     n = int(count[0])
     if not return_labels:
         return n
-    _cupy_adjust_labels(n, cupy.sort(root_labels[:n]), labels)
+    # root_labels is a bijection from {0..n-1} onto the root vertices, so
+    # relabeling only needs its inverse table: one scatter over the n
+    # roots and one gather per vertex, instead of a binary search over
+    # root_labels for each of the m vertices. The roots are taken in the
+    # order _cupy_count_components found them; the numbering is unordered
+    # either way (it already depended on the roots pylibcugraph picked),
+    # so the sort only cost an extra device-wide launch without pinning
+    # down the labels.
+    root_ranks = cupy.empty((m,), dtype=csgraph.indices.dtype)
+    _cupy_build_root_ranks(root_labels[:n], root_ranks)
+    _cupy_adjust_labels(root_ranks, labels)
     return n, labels
 
 
@@ -87,35 +125,49 @@ _cupy_count_components = cupy.ElementwiseKernel(
     '',
     'raw I labels, raw int32 count, raw int32 root_labels',
     '''
+    // Find the root with path halving: each visited vertex is pointed
+    // at its grandparent on the way down, so chains shrink while they
+    // are being walked instead of only after the root is known.
     int j = i;
-    while (j != labels[j]) { j = labels[j]; }
-    if (j != i) {
-        labels[i] = j;
-    } else {
+    int p = labels[j];
+    while (p != j) {
+        int g = labels[p];
+        labels[j] = g;
+        j = g;
+        p = labels[j];
+    }
+    if (j == i) {
         int k = atomicAdd(&count[0], 1);
         root_labels[k] = i;
+    } else {
+        // Full path compression: point every vertex on the walked chain
+        // at the root, not just vertex i, so threads sharing ancestors
+        // terminate after one load. Concurrent writes all store the same
+        // root and only shorten chains, so the race is benign.
+        int k = i;
+        while (k != j) {
+            int next = labels[k];
+            labels[k] = j;
+            k = next;
+        }
     }
     ''',
     '_cupy_count_components')
 
 
+_cupy_build_root_ranks = cupy.ElementwiseKernel(
+    'I root_label',
+    'raw I root_ranks',
+    '''
+    root_ranks[root_label] = i;
+    ''',
+    '_cupy_build_root_ranks')
+
+
 _cupy_adjust_labels = cupy.ElementwiseKernel(
-    'int32 n_root_labels, raw I root_labels',
+    'raw I root_ranks',
     'I labels',
     '''
-    int cur_label = labels;
-    int j_min = 0;
-    int j_max = n_root_labels - 1;
-    int j = (j_min + j_max) / 2;
-    while (j_min < j_max) {
-        if (cur_label == root_labels[j]) break;
-        if (cur_label < root_labels[j]) {
-            j_max = j - 1;
-        } else {
-            j_min = j + 1;
-        }
-        j = (j_min + j_max) / 2;
-    }
-    labels = j;
+    labels = root_ranks[labels];
     ''',
     '_cupy_adjust_labels')
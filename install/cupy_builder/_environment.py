@@ -1,26 +1,11 @@
 from __future__ import annotations
 
-from collections.abc import Callable
 import functools
-import glob
 import os
 import sys
-from typing import Any
 
 
-def _memoize(f: Callable) -> Callable:
-    memo = {}
-
-    @functools.wraps(f)
-    def ret(*args: Any, **kwargs: Any) -> Any:
-        key = (args, frozenset(kwargs.items()))
-        if key not in memo:
-            memo[key] = f(*args, **kwargs)
-        return memo[key]
-    return ret
-
-
-@_memoize
+@functools.lru_cache(maxsize=None)
 def get_nvtx_path() -> str | None:
     assert sys.platform == 'win32'
 
@@ -32,11 +17,18 @@ def get_nvtx_path() -> str | None:
     # $Env:ProgramFiles\NVIDIA Corporation\Nsight Systems 2025.3.2\
     # target-windows-x64\nvtx\include\nvtx3\nvToolsExt.h
     prog = os.environ.get('ProgramFiles', 'C:\\Program Files')
-    pattern = os.path.join(
-        prog, 'NVIDIA Corporation', 'Nsight Systems *', 'target-windows-x64',
-        'nvtx',
-    )
-    candidates += sorted(p for p in glob.glob(pattern) if os.path.exists(p))
+    nsight_dirs = []
+    try:
+        with os.scandir(os.path.join(prog, 'NVIDIA Corporation')) as it:
+            for entry in it:
+                if entry.name.startswith('Nsight Systems '):
+                    nvtx = os.path.join(
+                        entry.path, 'target-windows-x64', 'nvtx')
+                    if os.path.exists(nvtx):
+                        nsight_dirs.append(nvtx)
+    except OSError:
+        pass
+    candidates += sorted(nsight_dirs)
 
     # $Env:CUDA_PATH\include\nvtx3\nvToolsExt.h
     cuda_path = os.environ.get('CUDA_PATH', None)
@@ -9,6 +9,18 @@ from cupy import cuda
 from cupy.exceptions import AxisError
 
 
+class _CudaArrayInterfaceWrapper:
+    # Minimal non-ndarray ``__cuda_array_interface__`` exporter, standing
+    # in for an externally allocated device buffer passed as ``out``.
+
+    def __init__(self, a):
+        self._a = a
+
+    @property
+    def __cuda_array_interface__(self):
+        return self._a.__cuda_array_interface__
+
+
 class TestJoin:
 
     @testing.for_all_dtypes(name='dtype1')
@@ -38,6 +50,30 @@ class TestJoin:
         with pytest.raises(ValueError):
             cupy.column_stack((a, b))
 
+    @testing.for_all_dtypes(name='dtype')
+    def test_column_stack_out(self, dtype):
+        a = testing.shaped_arange((4, 3), cupy, dtype)
+        b = testing.shaped_arange((4,), cupy, dtype)
+        c = testing.shaped_arange((4, 2), cupy, dtype)
+        out = cupy.zeros((4, 6), dtype=dtype)
+        ret = cupy.column_stack((a, b, c), out=out)
+        assert ret is out
+        testing.assert_array_equal(out, cupy.column_stack((a, b, c)))
+
+    def test_column_stack_out_invalid_shape(self):
+        a = cupy.zeros((4, 3))
+        b = cupy.zeros((4, 2))
+        out = cupy.zeros((4, 4))
+        with pytest.raises(ValueError):
+            cupy.column_stack((a, b), out=out)
+
+    def test_column_stack_out_invalid_dtype(self):
+        a = cupy.zeros((4, 3))
+        b = cupy.zeros((4, 2))
+        out = cupy.zeros((4, 5), dtype=cupy.int64)
+        with pytest.raises(TypeError):
+            cupy.column_stack((a, b), out=out)
+
     @testing.for_all_dtypes(name='dtype')
     @testing.numpy_cupy_array_equal()
     def test_concatenate1(self, xp, dtype):
@@ -215,6 +251,21 @@ class TestJoin:
         out = xp.zeros((6, 4), dtype=dtype2)
         return xp.concatenate((a, b), out=out)
 
+    def test_concatenate_out_cuda_array_interface(self):
+        a = testing.shaped_arange((3, 4), cupy, cupy.float64)
+        b = testing.shaped_reverse_arange((3, 4), cupy, cupy.float64)
+        out = cupy.zeros((3, 8), dtype=cupy.float64)
+        cupy.concatenate(
+            (a, b), axis=1, out=_CudaArrayInterfaceWrapper(out))
+        testing.assert_array_equal(out, cupy.concatenate((a, b), axis=1))
+
+    def test_vstack_out_cuda_array_interface(self):
+        a = testing.shaped_arange((2, 3), cupy, cupy.float64)
+        b = testing.shaped_arange((3,), cupy, cupy.float64)
+        out = cupy.zeros((3, 3), dtype=cupy.float64)
+        cupy.vstack((a, b), out=_CudaArrayInterfaceWrapper(out))
+        testing.assert_array_equal(out, cupy.vstack((a, b)))
+
     @testing.with_requires('numpy>=1.20.0')
     @testing.for_all_dtypes_combination(names=['dtype1', 'dtype2'])
     @testing.numpy_cupy_array_equal(accept_error=TypeError)
@@ -272,6 +323,30 @@ class TestJoin:
         a = testing.shaped_arange((1,), xp)
         return xp.dstack((a,))
 
+    @testing.for_all_dtypes(name='dtype')
+    def test_dstack_out(self, dtype):
+        a = testing.shaped_arange((1, 3, 2), cupy, dtype)
+        b = testing.shaped_arange((3,), cupy, dtype)
+        c = testing.shaped_arange((1, 3), cupy, dtype)
+        out = cupy.zeros((1, 3, 4), dtype=dtype)
+        ret = cupy.dstack((a, b, c), out=out)
+        assert ret is out
+        testing.assert_array_equal(out, cupy.dstack((a, b, c)))
+
+    def test_dstack_out_invalid_shape(self):
+        a = cupy.zeros((1, 3, 2))
+        b = cupy.zeros((1, 3, 1))
+        out = cupy.zeros((1, 3, 4))
+        with pytest.raises(ValueError):
+            cupy.dstack((a, b), out=out)
+
+    def test_dstack_out_invalid_dtype(self):
+        a = cupy.zeros((1, 3, 2))
+        b = cupy.zeros((1, 3, 1))
+        out = cupy.zeros((1, 3, 3), dtype=cupy.int64)
+        with pytest.raises(TypeError):
+            cupy.dstack((a, b), out=out)
+
     @testing.numpy_cupy_array_equal()
     def test_hstack_vectors(self, xp):
         a = xp.arange(3)
@@ -292,6 +367,30 @@ class TestJoin:
         c = testing.shaped_arange((2, 3), xp)
         return xp.hstack((a, b, c))
 
+    @testing.for_all_dtypes(name='dtype')
+    def test_hstack_out(self, dtype):
+        a = testing.shaped_arange((2, 1), cupy, dtype)
+        b = testing.shaped_arange((2, 2), cupy, dtype)
+        c = testing.shaped_arange((2, 3), cupy, dtype)
+        out = cupy.zeros((2, 6), dtype=dtype)
+        ret = cupy.hstack((a, b, c), out=out)
+        assert ret is out
+        testing.assert_array_equal(out, cupy.hstack((a, b, c)))
+
+    def test_hstack_out_invalid_shape(self):
+        a = cupy.zeros((2, 1))
+        b = cupy.zeros((2, 2))
+        out = cupy.zeros((2, 4))
+        with pytest.raises(ValueError):
+            cupy.hstack((a, b), out=out)
+
+    def test_hstack_out_invalid_dtype(self):
+        a = cupy.zeros((2, 1))
+        b = cupy.zeros((2, 2))
+        out = cupy.zeros((2, 3), dtype=cupy.int64)
+        with pytest.raises(TypeError):
+            cupy.hstack((a, b), out=out)
+
     @testing.with_requires('numpy>=1.24.0')
     @testing.for_all_dtypes_combination(names=['dtype1', 'dtype2'])
     @testing.numpy_cupy_array_equal(accept_error=TypeError)
@@ -335,6 +434,30 @@ class TestJoin:
         with pytest.raises(ValueError):
             cupy.vstack((a, b))
 
+    @testing.for_all_dtypes(name='dtype')
+    def test_vstack_out(self, dtype):
+        a = testing.shaped_arange((4, 3), cupy, dtype)
+        b = testing.shaped_arange((3,), cupy, dtype)
+        c = testing.shaped_arange((2, 3), cupy, dtype)
+        out = cupy.zeros((7, 3), dtype=dtype)
+        ret = cupy.vstack((a, b, c), out=out)
+        assert ret is out
+        testing.assert_array_equal(out, cupy.vstack((a, b, c)))
+
+    def test_vstack_out_invalid_shape(self):
+        a = cupy.zeros((4, 3))
+        b = cupy.zeros((2, 3))
+        out = cupy.zeros((5, 3))
+        with pytest.raises(ValueError):
+            cupy.vstack((a, b), out=out)
+
+    def test_vstack_out_invalid_dtype(self):
+        a = cupy.zeros((4, 3))
+        b = cupy.zeros((2, 3))
+        out = cupy.zeros((6, 3), dtype=cupy.int64)
+        with pytest.raises(TypeError):
+            cupy.vstack((a, b), out=out)
+
     @testing.with_requires('numpy>=1.24.0')
     @testing.for_all_dtypes_combination(names=['dtype1', 'dtype2'])
     @testing.numpy_cupy_array_equal(accept_error=TypeError)
@@ -513,23 +636,28 @@ class TestJoin:
         a = testing.shaped_arange((4, 3), xp, dtype1)
         b = testing.shaped_arange((3,), xp, dtype2)
         c = testing.shaped_arange((2, 3), xp, dtype1)
+        # cupy.row_stack warns only once per process
+        cupy._manipulation.join._row_stack_warned = False
         with pytest.warns(DeprecationWarning):
             return xp.row_stack((a, b, c))
 
     def test_row_stack_wrong_ndim1(self):
         a = cupy.zeros(())
         b = cupy.zeros((3,))
+        cupy._manipulation.join._row_stack_warned = False
         with pytest.raises(ValueError), pytest.warns(DeprecationWarning):
             cupy.row_stack((a, b))
 
     def test_row_stack_wrong_ndim2(self):
         a = cupy.zeros((3, 2, 3))
         b = cupy.zeros((3, 2))
+        cupy._manipulation.join._row_stack_warned = False
         with pytest.raises(ValueError), pytest.warns(DeprecationWarning):
             cupy.row_stack((a, b))
 
     def test_row_stack_wrong_shape(self):
         a = cupy.zeros((3, 2))
         b = cupy.zeros((4, 3))
+        cupy._manipulation.join._row_stack_warned = False
         with pytest.raises(ValueError), pytest.warns(DeprecationWarning):
             cupy.row_stack((a, b))
@@ -6,16 +6,24 @@ import math
 from cupyx.distributed.array import _index_arith
 
 
-def test_extgcd():
+def test_crt():
     iteration = 300
     max_value = 100
 
     for _ in range(iteration):
-        a = random.randint(1, max_value)
-        b = random.randint(1, max_value)
-        g, x = _index_arith._extgcd(a, b)
-        assert g == math.gcd(a, b)
-        assert (g - a * x) % b == 0
+        a1 = random.randint(0, max_value - 1)
+        a2 = random.randint(0, max_value - 1)
+        n1 = random.randint(1, max_value)
+        n2 = random.randint(1, max_value)
+        result = _index_arith._crt(a1, n1, a2, n2)
+        expected = [x for x in range(max(a1, a2), max_value * max_value)
+                    if x % n1 == a1 % n1 and x % n2 == a2 % n2]
+        if result is None:
+            assert not expected
+        else:
+            x, n = result
+            assert x == expected[0]
+            assert n == n1 * n2 // math.gcd(n1, n2)
 
 
 def test_slice_intersection():